@@ -3,25 +3,35 @@
 BirdBathController - Main controller for running pattern processes.
 """
 
+from __future__ import annotations
+
 import sys
 import argparse
+import gc
 import importlib
 import multiprocessing
+import multiprocessing.connection
 import time
 import yaml
 import os
 import json
 import struct
-import pickle
-import numpy as np
 import threading
+import atexit
+import logging
+import logging.handlers
+import queue
 import socket
 import re
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
-from typing import List, Dict, Any, Optional, Tuple
-from pattern_runner import PatternRunner
-from pattern_driver import PatternDriver
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+# numpy (and frame_exchange, which pulls in numpy and optionally numba) is only
+# imported once run mode actually starts, so --help and config errors exit fast
+if TYPE_CHECKING:
+    import numpy as np
+    from frame_exchange import FrameExchange
 
 # ---------------------------------------------------------------------------
 # Beertap calibration support (optional — hardware libraries only on Pi)
@@ -37,6 +47,44 @@ except Exception as e:
     beertap_calibration_core = None  # type: ignore
     _BEERTAPS_AVAILABLE = False
 
+# ADC pipe frame layout and channel id table, shared with adc_reader.py
+from adc_message import CHANNEL_NAMES as _ADC_CHANNEL_NAMES, CHANNEL_IDS as _ADC_CHANNEL_IDS, FRAME as _ADC_FRAME
+
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader, CSafeDumper as _YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader, SafeDumper as _YamlSafeDumper
+
+# orjson is optional; when present GET /nozzles encodes the numpy frame directly
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# ---------------------------------------------------------------------------
+# Frame loop logging
+# ---------------------------------------------------------------------------
+
+# Messages from the frame loop go through this logger; a QueueListener thread
+# does the actual write so the loop never blocks on stdout/journald.
+log = logging.getLogger('birdbath')
+
+
+def start_frame_logging() -> logging.handlers.QueueListener:
+    """Attach a queue-backed stdout handler to the frame loop logger."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 
 # ---------------------------------------------------------------------------
 # Mode persistence
@@ -51,6 +99,21 @@ VALID_MODES = {'run', 'configure'}
 ARTNET_FRAME = 0
 ARTNET_NOZZLE = 1
 
+# 16-bit ArtDMX header fields (opcode/universe are little endian,
+# protocol version/length big endian)
+_ARTNET_U16_LE = struct.Struct("<H")
+_ARTNET_U16_BE = struct.Struct(">H")
+
+# CPU layout: the main frame loop and the pattern driver each get a core of
+# their own, and the pattern processes share whatever cores are left
+MAIN_CPU = 0
+DRIVER_CPU = 1
+FIRST_PATTERN_CPU = 2
+
+# Longest the frame loop waits for pattern processes to publish their frames
+FRAME_RESULT_TIMEOUT = 1.0
+FRAME_RESULT_TIMEOUT_NS = int(FRAME_RESULT_TIMEOUT * 1_000_000_000)
+
 
 def load_persisted_mode() -> str:
     """Load the last saved mode from birdbath_state.json, defaulting to 'run'."""
@@ -77,115 +140,204 @@ def save_persisted_mode(mode: str):
         print(f"Warning: could not save mode to {STATE_FILE}: {e}")
 
 
-def pattern_driver_process(conn):
+def _pin_to_cpu(cpu: int, label: str):
     """
-    Process function that creates and runs a PatternDriver.
-
-    Args:
-        conn: Pipe connection object for communication with main process
+    Pin the calling process to a single CPU so its working set stays in one
+    core's caches. No-op where sched_setaffinity is unavailable (macOS).
     """
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    cpu = cpu % (os.cpu_count() or 1)
     try:
-        print("Starting pattern driver process")
+        os.sched_setaffinity(0, {cpu})
+        print(f"{label} pinned to CPU {cpu}")
+    except OSError as e:
+        print(f"Warning: could not pin {label} to CPU {cpu}: {e}")
 
-        # Create the PatternDriver
-        driver = PatternDriver()
-        print("Successfully created PatternDriver")
 
-        # Main driver execution loop - wait for frame data
-        frame_count = 0
-        while True:
+def _pattern_cpu(process_id: int) -> int:
+    """
+    CPU for pattern process *process_id*: FIRST_PATTERN_CPU onwards, wrapping
+    around within those cores so extra processes double up with each other
+    rather than with the main loop or the driver. Machines with too few cores
+    for that just spread the processes over all of them.
+    """
+    spare = (os.cpu_count() or 1) - FIRST_PATTERN_CPU
+    if spare <= 0:
+        return process_id
+    return FIRST_PATTERN_CPU + process_id % spare
+
+
+class FrameClock:
+    """
+    Paces the frame loop at a fixed interval against absolute deadlines, so
+    per-frame overruns don't accumulate as drift.
+
+    Uses a periodic timerfd where the os module has one (Linux, Python 3.13+):
+    the kernel keeps the schedule and each wait is a single read. Elsewhere
+    it sleeps until the next deadline. Either way, missed slots are dropped
+    rather than run back to back to catch up.
+
+    Deadlines are kept as integer time.monotonic_ns() values, so they never
+    accumulate floating-point rounding over a long run.
+    """
+
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval (float): Frame interval in seconds
+        """
+        self.interval_ns = round(interval * 1_000_000_000)
+        # Start of the current frame, in time.monotonic_ns() nanoseconds
+        self.frame_start_ns = time.monotonic_ns()
+        self._tfd = None
+        if hasattr(os, 'timerfd_create'):
             try:
-                # Wait for frame data from main process
-                message = conn.recv()
+                self._tfd = os.timerfd_create(time.CLOCK_MONOTONIC)
+                os.timerfd_settime_ns(self._tfd, flags=os.TFD_TIMER_ABSTIME,
+                                      initial=self.frame_start_ns + self.interval_ns,
+                                      interval=self.interval_ns)
+            except OSError as e:
+                print(f"Warning: timerfd unavailable, pacing frames with sleep: {e}")
+                self.close()
+
+    def wait(self):
+        """Block until the next frame slot and advance frame_start_ns to it."""
+        if self._tfd is not None:
+            # Number of ticks since the last read; more than one means we ran late
+            ticks = int.from_bytes(os.read(self._tfd, 8), sys.byteorder)
+            self.frame_start_ns += ticks * self.interval_ns
+            return
 
-                if message is None or message == 'shutdown':
-                    print("Pattern driver process received shutdown signal")
-                    break
+        self.frame_start_ns += self.interval_ns
+        remaining_ns = self.frame_start_ns - time.monotonic_ns()
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1_000_000_000)
+        else:
+            # Running late: drop the missed slot rather than bursting to catch up
+            self.frame_start_ns -= remaining_ns
 
-                if isinstance(message, tuple) and len(message) == 2:
-                    command, frame_data = message
-                    if command == 'frame_data':
-                        # Process frame data with the PatternDriver
-                        driver.Frame(frame_data)
+    def close(self):
+        if self._tfd is not None:
+            os.close(self._tfd)
+            self._tfd = None
 
-                        frame_count += 1
-                        if frame_count % 100 == 0:  # Print status every 100 frames
-                            print(f"Pattern driver - Frame {frame_count}: Processed frame data")
-                    else:
-                        print(f"Pattern driver received unknown command: {command}")
-                else:
-                    print(f"Pattern driver received invalid message format: {message}")
 
-            except EOFError:
-                print("Pattern driver - pipe closed by main process")
-                break
-            except Exception as e:
-                print(f"Error in pattern driver process: {str(e)}")
-                break
+# Young-generation threshold while a frame loop runs. The loops allocate
+# only a handful of short-lived objects per frame and create no cycles, so
+# the default (700) just means a collection every few frames.
+GC_FRAME_LOOP_THRESHOLD = 100_000
 
-    except Exception as e:
-        print(f"Failed to create PatternDriver: {str(e)}")
-        return
-    finally:
-        conn.close()
+
+def _prepare_gc_for_frame_loop():
+    """
+    Collect once, move everything allocated during startup (modules, config,
+    pattern objects) out of the collector's view with gc.freeze(), and raise
+    the generation-0 threshold so collections stop landing mid-frame.
+
+    Safe to call again on each switch into run mode: objects frozen last time
+    are unfrozen first so garbage from the previous run can still be collected.
+    """
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(GC_FRAME_LOOP_THRESHOLD, 50, 50)
 
 
-def pattern_process(pattern_name: str, process_id: int, conn):
+def pattern_driver_process(exchange: FrameExchange):
     """
-    Process function that creates and runs a PatternRunner with pipe communication.
+    Process function that creates and runs a PatternDriver.
+
+    Each frame the driver sums and clamps the pattern rows of the shared
+    FrameExchange itself and sends the result to the controllers, so the frame
+    never passes through the main process.
 
     Args:
-        pattern_name (str): Name of the pattern class to instantiate and run
-        process_id (int): Unique identifier for this process (0-5)
-        conn: Pipe connection object for communication with main process
+        exchange (FrameExchange): Shared frame buffers and semaphores
     """
     try:
-        print(f"Starting pattern process {process_id} with pattern: {pattern_name}")
+        print("Starting pattern driver process")
+        # Imported here so the forkserver doesn't have to load it up front
+        from pattern_driver import PatternDriver
+        _pin_to_cpu(DRIVER_CPU, "Pattern driver")
 
-        # Create the PatternRunner with the specified pattern
-        runner = PatternRunner(pattern_name)
-        print(f"Successfully created PatternRunner for {pattern_name} (Process {process_id})")
+        # Create the PatternDriver
+        driver = PatternDriver()
+        print("Successfully created PatternDriver")
+        _prepare_gc_for_frame_loop()
+    except Exception as e:
+        print(f"Failed to create PatternDriver: {str(e)}")
+        return
 
-        # Main pattern execution loop - wait for frame requests
-        frame_count = 0
-        while True:
-            try:
-                # Wait for frame request from main process
-                message = conn.recv()
+    # Main driver execution loop - wait for each frame's rows
+    frame_count = 0
+    while True:
+        if not exchange.wait_for_frame_ready():
+            print("Pattern driver process received shutdown signal")
+            break
 
-                if message is None or message == 'shutdown':
-                    print(f"Pattern process {process_id} ({pattern_name}) received shutdown signal")
-                    break
+        try:
+            # Sum the pattern rows, then process frame data with the PatternDriver
+            exchange.reduce_final()
+            driver.Frame(exchange.final)
 
-                if isinstance(message, tuple) and len(message) == 2:
-                    command, input_value = message
-                    if command == 'start_frame':
-                        # Generate frame with the provided input value
-                        result = runner.run_frame(input_value)
+            frame_count += 1
+            if frame_count % 100 == 0:  # Print status every 100 frames
+                print(f"Pattern driver - Frame {frame_count}: Processed frame data")
+        except Exception as e:
+            print(f"Error in pattern driver process: {str(e)}")
+            break
 
-                        # Send result back to main process
-                        conn.send(result)
 
-                        frame_count += 1
-                        if frame_count % 100 == 0:  # Print status every 100 frames
-                            print(f"Process {process_id} ({pattern_name}) - Frame {frame_count}: Generated {len(result)} values")
-                    else:
-                        print(f"Process {process_id} ({pattern_name}) received unknown command: {command}")
-                else:
-                    print(f"Process {process_id} ({pattern_name}) received invalid message format: {message}")
+def pattern_process(pattern_name: str, process_id: int, exchange: FrameExchange):
+    """
+    Process function that creates and runs a PatternRunner on the shared FrameExchange.
 
-            except EOFError:
-                print(f"Pattern process {process_id} ({pattern_name}) - pipe closed by main process")
-                break
-            except Exception as e:
-                print(f"Error in pattern process {process_id} ({pattern_name}): {str(e)}")
-                break
+    Each frame the main process writes this process's input value and releases
+    its start semaphore. The pattern's values array is this process's row of
+    the exchange, so the pattern writes its frame straight into shared memory.
+
+    Args:
+        pattern_name (str): Name of the pattern class to instantiate and run
+        process_id (int): Unique identifier for this process (0-5), also its FrameExchange row
+        exchange (FrameExchange): Shared frame buffers and semaphores
+    """
+    try:
+        print(f"Starting pattern process {process_id} with pattern: {pattern_name}")
+        # Imported here so the forkserver doesn't have to load it up front
+        from pattern_runner import PatternRunner
+        _pin_to_cpu(_pattern_cpu(process_id), f"Pattern process {process_id}")
 
+        # Create the PatternRunner with the specified pattern, writing into our row
+        runner = PatternRunner(pattern_name, exchange.frames[process_id])
+        row = runner.values_array
+        print(f"Successfully created PatternRunner for {pattern_name} (Process {process_id})")
+        _prepare_gc_for_frame_loop()
     except Exception as e:
         print(f"Failed to create PatternRunner for {pattern_name} (Process {process_id}): {str(e)}")
         return
-    finally:
-        conn.close()
+
+    # Main pattern execution loop - wait for frame requests
+    frame_count = 0
+    while True:
+        if not exchange.wait_for_start(process_id):
+            print(f"Pattern process {process_id} ({pattern_name}) received shutdown signal")
+            break
+
+        try:
+            # Generate frame with this pattern's input value
+            result = runner.run_frame(float(exchange.inputs[process_id]))
+
+            # Publish result to main process; only copied if the pattern
+            # returned some other array instead of filling its values array
+            exchange.publish(process_id, None if result is row else result)
+
+            frame_count += 1
+            if frame_count % 100 == 0:  # Print status every 100 frames
+                print(f"Process {process_id} ({pattern_name}) - Frame {frame_count}: Generated {len(result)} values")
+        except Exception as e:
+            print(f"Error in pattern process {process_id} ({pattern_name}): {str(e)}")
+            break
 
 
 class PipeReader:
@@ -195,9 +347,18 @@ class PipeReader:
 
     def __init__(self, pipe_path='/tmp/adc_pipe_main'):
         self.pipe_path = pipe_path
-        self.buffer = b''
+        self.buffer = bytearray()  # Partial frame left over from the last read
+        # Reads land here instead of in a new bytes object each frame;
+        # sized to the default pipe capacity so one read drains the pipe
+        self._scratch = bytearray(65536)
+        self._scratch_view = memoryview(self._scratch)
         self.pipe_fd = None
-        self.channel_values = {}  # Dictionary to store latest value for each channel
+        # Only created once run mode starts, so numpy is loaded by then
+        import numpy as np
+        # Latest value per channel, indexed by pipe frame channel id (the
+        # order of adc_message.CHANNEL_NAMES). The extra last slot stays 0.0
+        # and stands in for channels the ADC readers don't provide.
+        self.values = np.zeros(len(_ADC_CHANNEL_NAMES) + 1, dtype=np.float64)
 
     def open_pipe(self):
         """Open the named pipe for reading."""
@@ -213,64 +374,78 @@ class PipeReader:
             print(f"Error opening named pipe {self.pipe_path}: {str(e)}")
             return False
 
+    def channel_indices(self, channels: List[str]) -> np.ndarray:
+        """
+        Map channel names to their slots in self.values, so callers can look
+        up many channels with one np.take instead of a lookup per name.
+
+        Args:
+            channels (List[str]): Channel names, e.g. each pattern's input_channel
+
+        Returns:
+            np.ndarray: Index into self.values for each channel
+        """
+        import numpy as np
+        unknown = len(self.values) - 1
+        return np.array([_ADC_CHANNEL_IDS.get(ch, unknown) for ch in channels], dtype=np.intp)
+
     def read_latest_values(self):
         """
         Read all available messages from the pipe and update channel values.
 
         Returns:
-            Dict[str, float]: Dictionary mapping channel names to their latest values
+            np.ndarray: Latest value per channel, indexed as described for self.values
         """
         if self.pipe_fd is None:
-            print("No pipe, no values\n")
-            return self.channel_values
+            log.debug("No pipe, no values")
+            return self.values
 
         try:
             # Read available data (non-blocking)
-            chunk = os.read(self.pipe_fd, 4096)
-            if chunk:
-                self.buffer += chunk
+            n = os.readv(self.pipe_fd, [self._scratch])
         except OSError:
             # No data available (EAGAIN/EWOULDBLOCK)
-            print("Read latest value: No data")
-            return self.channel_values
+            log.debug("Read latest value: No data")
+            return self.values
         except Exception as e:
-            print(f"Error reading from pipe: {str(e)}")
-            return self.channel_values
+            log.warning("Error reading from pipe: %s", e)
+            return self.values
 
         # Process complete messages from buffer
         # Note here that we can end up with more than one message per channel
         # TODO - average values, if we have more than one.
-        while len(self.buffer) >= 4:
-            try:
-                # Read length header
-                length = struct.unpack('>I', self.buffer[:4])[0]
-
-                # Check if we have the complete message
-                if len(self.buffer) >= 4 + length:
-                    # Extract and unpickle the message
-                    pickled_data = self.buffer[4:4+length]
-                    self.buffer = self.buffer[4+length:]
-
-                    data = pickle.loads(pickled_data)
-
-                    # Extract channel and value
-                    if isinstance(data, dict) and 'channel' in data and 'value' in data:
-                        channel = data['channel']
-                        value = float(data['value'])
-                        # Clamp to expected range just in case
-                        value = max(-1.0, min(1.0, value))
-
-                        # Update channel value
-                        self.channel_values[channel] = value
+        # Frames are fixed size (channel id + float32), so there is no header
+        # to parse and nothing to validate beyond the channel id.
+        # Usually nothing is left over, and the frames are unpacked straight
+        # out of the scratch buffer; otherwise they're appended to the leftover
+        # partial frame first.
+        if self.buffer:
+            self.buffer += self._scratch_view[:n]
+            data = memoryview(self.buffer)
+            n = len(self.buffer)
+        else:
+            data = self._scratch_view
+        usable = n - n % _ADC_FRAME.size
+
+        values = self.values
+        channel_count = len(values) - 1
+        with data[:usable] as frames:
+            for channel_id, value in _ADC_FRAME.iter_unpack(frames):
+                if channel_id < channel_count:
+                    # Clamp to expected range just in case
+                    values[channel_id] = max(-1.0, min(1.0, value))
                 else:
-                    break
-            except Exception as e:
-                print(f"Error parsing pipe message: {str(e)}")
-                # Clear buffer on parse error
-                self.buffer = b''
-                break
+                    log.warning("Unknown channel id %s in pipe frame", channel_id)
+        if data is not self._scratch_view:
+            data.release()
 
-        return self.channel_values
+        # Keep any trailing partial frame for the next read, trimming once
+        if self.buffer:
+            del self.buffer[:usable]
+        elif usable < n:
+            self.buffer += self._scratch_view[usable:n]
+
+        return self.values
 
     def get_channel_value(self, channel: str) -> float:
         """
@@ -282,7 +457,8 @@ class PipeReader:
         Returns:
             float: Latest value for the channel, or 0.0 if channel not found
         """
-        return self.channel_values.get(channel, 0.0)
+        channel_id = _ADC_CHANNEL_IDS.get(channel)
+        return 0.0 if channel_id is None else float(self.values[channel_id])
 
     def close_pipe(self):
         """Close the named pipe."""
@@ -308,13 +484,16 @@ class AppState:
     def __init__(self, initial_mode: str):
         self.lock = threading.Lock()
         self._mode: str = initial_mode
-        # Latest frame data written by the frame loop, read by GET /nozzles
-        self._latest_frame: np.ndarray = np.zeros(36, dtype=np.float64)
+        # Latest frame data written by the frame loop, read by GET /nozzles.
+        # None until the first frame, which avoids needing numpy here.
+        self._latest_frame: Optional[np.ndarray] = None
+        # Bumped only when the frame actually changes; keys the encoded payload cache
+        self._frame_seq: int = 0
+        self._frame_payloads: Dict[str, Tuple[int, bytes]] = {}
         # Subprocess handles for run mode
         self._driver_process = None
-        self._driver_conn = None
         self._pattern_processes: list = []
-        self._pattern_pipes: list = []
+        self._exchange = None
         # Event that tells the frame loop to exit
         self._stop_run_event = threading.Event()
         # Mode transition request
@@ -335,31 +514,55 @@ class AppState:
 
     def update_latest_frame(self, frame: np.ndarray):
         with self.lock:
-            np.copyto(self._latest_frame, frame)
+            if self._latest_frame is None:
+                self._latest_frame = frame.copy()
+            # Idle frames are usually identical; leave the cached payloads valid
+            elif (self._latest_frame == frame).all():
+                return
+            else:
+                self._latest_frame[:] = frame
+            self._frame_seq += 1
 
-    def get_latest_frame(self) -> np.ndarray:
+    def get_latest_frame(self) -> Optional[np.ndarray]:
         with self.lock:
-            return self._latest_frame.copy()
+            return None if self._latest_frame is None else self._latest_frame.copy()
+
+    def get_latest_frame_payload(self, kind: str, encode) -> bytes:
+        """
+        Return encode(latest_frame), re-encoding only when the frame has changed.
 
-    def store_run_handles(self, driver_process, driver_conn,
-                          pattern_processes, pattern_pipes):
+        Args:
+            kind (str): Cache key for this encoding (e.g. 'json', 'bin')
+            encode: Function taking the frame ndarray (or None before the
+                first frame) and returning bytes
+        """
+        with self.lock:
+            seq = self._frame_seq
+            cached = self._frame_payloads.get(kind)
+            if cached is not None and cached[0] == seq:
+                return cached[1]
+            frame = None if self._latest_frame is None else self._latest_frame.copy()
+        payload = encode(frame)
+        with self.lock:
+            self._frame_payloads[kind] = (seq, payload)
+        return payload
+
+    def store_run_handles(self, driver_process, pattern_processes, exchange):
         with self.lock:
             self._driver_process = driver_process
-            self._driver_conn = driver_conn
             self._pattern_processes = pattern_processes
-            self._pattern_pipes = pattern_pipes
+            self._exchange = exchange
 
     def clear_run_handles(self):
         with self.lock:
             self._driver_process = None
-            self._driver_conn = None
             self._pattern_processes = []
-            self._pattern_pipes = []
+            self._exchange = None
 
     def get_run_handles(self):
         with self.lock:
-            return (self._driver_process, self._driver_conn,
-                    list(self._pattern_processes), list(self._pattern_pipes))
+            return (self._driver_process, list(self._pattern_processes),
+                    self._exchange)
 
     def request_run_stop(self):
         self._stop_run_event.set()
@@ -426,7 +629,7 @@ def load_configuration(config_file: str) -> Tuple[List[Dict[str, str]], float]:
 
     try:
         with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlSafeLoader)
 
         # Configuration must be a dictionary with 'patterns' key
         if not isinstance(config, dict):
@@ -496,14 +699,14 @@ def load_driver_config(config_file: str = 'driver_config.yaml') -> dict:
         _save_driver_config(default, config_file)
         return default
     with open(config_file, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlSafeLoader)
 
 
 def _save_driver_config(config: dict, config_file: str = 'driver_config.yaml'):
     """Atomically write driver_config.yaml."""
     tmp = config_file + '.tmp'
     with open(tmp, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, indent=2)
+        yaml.dump(config, f, Dumper=_YamlSafeDumper, default_flow_style=False, indent=2)
     os.replace(tmp, config_file)
 
 
@@ -551,59 +754,48 @@ def discover_available_patterns(patterns_dir: str = 'patterns') -> List[str]:
 def start_run_mode(app_state: AppState, config_file: str, daemon: bool = False):
     """
     Load pattern config, start PatternDriver + PatternRunner subprocesses, store
-    handles in app_state.  Returns (patterns, frame_interval).
+    handles in app_state.  Returns (patterns, frame_interval, exchange).
     """
     patterns, frame_interval = load_configuration(config_file)
     descriptions = [f"{p['pattern']}({p['input_channel']})" for p in patterns]
     print(f"Starting run mode: {', '.join(descriptions)}, interval {frame_interval*1000:.1f}ms")
 
-    driver_parent_conn, driver_child_conn = multiprocessing.Pipe()
+    from frame_exchange import FrameExchange
+    exchange = FrameExchange(len(patterns))
     driver_process = multiprocessing.Process(
-        target=pattern_driver_process, args=(driver_child_conn,), name="PatternDriver"
+        target=pattern_driver_process, args=(exchange,), name="PatternDriver"
     )
     if daemon:
         driver_process.daemon = True
     driver_process.start()
-    driver_child_conn.close()
     print(f"Started PatternDriver (PID {driver_process.pid})")
 
-    processes, pipes = [], []
+    processes = []
     for i, pcfg in enumerate(patterns):
-        parent_conn, child_conn = multiprocessing.Pipe()
         proc = multiprocessing.Process(
             target=pattern_process,
-            args=(pcfg['pattern'], i, child_conn),
+            args=(pcfg['pattern'], i, exchange),
             name=f"Pattern-{i}-{pcfg['pattern']}",
         )
         if daemon:
             proc.daemon = True
         proc.start()
-        child_conn.close()
-        processes.append((proc, pcfg['pattern'], pcfg['input_channel'], i))
-        pipes.append(parent_conn)
+        processes.append(proc)
         print(f"Started Pattern-{i} ({pcfg['pattern']}, PID {proc.pid})")
 
-    app_state.store_run_handles(driver_process, driver_parent_conn, processes, pipes)
-    return patterns, frame_interval
+    app_state.store_run_handles(driver_process, processes, exchange)
+    return patterns, frame_interval, exchange
 
 
 def stop_run_mode(app_state: AppState):
     """Signal the frame loop to exit and shut down all run-mode subprocesses."""
     app_state.request_run_stop()
-    driver_proc, driver_conn, processes, pipes = app_state.get_run_handles()
+    driver_proc, processes, exchange = app_state.get_run_handles()
 
-    for target_conn in ([driver_conn] if driver_conn else []) + pipes:
-        try:
-            target_conn.send('shutdown')
-        except Exception:
-            pass
-    for target_conn in ([driver_conn] if driver_conn else []) + pipes:
-        try:
-            target_conn.close()
-        except Exception:
-            pass
+    if exchange:
+        exchange.shutdown()
 
-    all_procs = ([driver_proc] if driver_proc else []) + [p for p, *_ in processes]
+    all_procs = ([driver_proc] if driver_proc else []) + processes
     for proc in all_procs:
         if proc and proc.is_alive():
             proc.terminate()
@@ -651,13 +843,15 @@ def send_nozzle_position_artnet(nozzle_id: int, raw_value: float, controllers: l
         return False
     controller_ip = controllers[controller_idx]['ip']
 
-    header = b"Art-Net\x00"
-    opcode = struct.pack("<H", 0x5000)
-    proto = struct.pack(">H", 14)
-    universe = struct.pack("<H", controller_idx)
-    payload = bytearray([ARTNET_NOZZLE, channel_in_controller, 0, max(0, min(255, int(raw_value)))])
-    data_length = struct.pack(">H", len(payload))
-    packet = header + opcode + proto + b"\x00\x00" + universe + data_length + bytes(payload)
+    payload = (ARTNET_NOZZLE, channel_in_controller, 0, max(0, min(255, int(raw_value))))
+    packet = bytearray(18 + len(payload))
+    packet[0:8] = b"Art-Net\x00"
+    _ARTNET_U16_LE.pack_into(packet, 8, 0x5000)
+    _ARTNET_U16_BE.pack_into(packet, 10, 14)
+    # bytes 12-13 (sequence, physical) stay 0
+    _ARTNET_U16_LE.pack_into(packet, 14, controller_idx)
+    _ARTNET_U16_BE.pack_into(packet, 16, len(payload))
+    packet[18:] = bytes(payload)
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
@@ -674,6 +868,22 @@ def send_nozzle_position_artnet(nozzle_id: int, raw_value: float, controllers: l
 # HTTP request handler
 # ---------------------------------------------------------------------------
 
+def _encode_frame_json(frame: Optional[np.ndarray]) -> bytes:
+    """Encode a frame for GET /nozzles."""
+    if frame is None:
+        return json.dumps([0.0] * 36).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(frame, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(frame.tolist()).encode('utf-8')
+
+
+def _encode_frame_bin(frame: Optional[np.ndarray]) -> bytes:
+    """Encode a frame for GET /nozzles.bin: 36 little-endian float32 values."""
+    if frame is None:
+        return bytes(36 * 4)
+    return frame.astype('<f4', copy=False).tobytes()
+
+
 class BirdbathHTTPHandler(BaseHTTPRequestHandler):
     """
     Mode-aware HTTP handler.  app_state and driver_config_file are injected
@@ -693,6 +903,11 @@ class BirdbathHTTPHandler(BaseHTTPRequestHandler):
             self._serve_page(mode)
         elif path == '/nozzles':
             self._serve_run_nozzles() if mode == 'run' else self._serve_configure_nozzles()
+        elif path == '/nozzles.bin':
+            if mode == 'run':
+                self._serve_run_nozzles_bin()
+            else:
+                self._send_json(404, {'error': '/nozzles.bin is only available in run mode'})
         elif path == '/mode':
             self._send_json(200, {'mode': mode})
         elif path == '/patterns/available':
@@ -766,7 +981,12 @@ class BirdbathHTTPHandler(BaseHTTPRequestHandler):
             self._send_json(404, {'error': f'Page not found: {filename}'})
 
     def _serve_run_nozzles(self):
-        self._send_json(200, self.app_state.get_latest_frame().tolist())
+        payload = self.app_state.get_latest_frame_payload('json', _encode_frame_json)
+        self._send_payload(200, payload)
+
+    def _serve_run_nozzles_bin(self):
+        payload = self.app_state.get_latest_frame_payload('bin', _encode_frame_bin)
+        self._send_payload(200, payload, 'application/octet-stream')
 
     def _serve_configure_nozzles(self):
         controllers = self._get_controllers()
@@ -881,9 +1101,12 @@ class BirdbathHTTPHandler(BaseHTTPRequestHandler):
             self._send_json(400, {'error': f'Invalid JSON: {e}'}); return None
 
     def _send_json(self, code: int, data):
-        payload = json.dumps(data, indent=2).encode('utf-8')
+        self._send_payload(code, json.dumps(data, indent=2).encode('utf-8'))
+
+    def _send_payload(self, code: int, payload: bytes,
+                      content_type: str = 'application/json'):
         self.send_response(code)
-        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Type', content_type)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         self.wfile.write(payload)
@@ -900,7 +1123,7 @@ class BirdbathHTTPHandler(BaseHTTPRequestHandler):
         """Return current patterns.yaml as JSON."""
         try:
             with open(self.patterns_config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlSafeLoader)
             self._send_json(200, config)
         except FileNotFoundError:
             self._send_json(404, {'error': f'Config file not found: {self.patterns_config_file}'})
@@ -946,7 +1169,7 @@ class BirdbathHTTPHandler(BaseHTTPRequestHandler):
         tmp = self.patterns_config_file + '.tmp'
         try:
             with open(tmp, 'w') as f:
-                yaml.dump(new_config, f, default_flow_style=False, indent=2)
+                yaml.dump(new_config, f, Dumper=_YamlSafeDumper, default_flow_style=False, indent=2)
             os.replace(tmp, self.patterns_config_file)
         except Exception as e:
             self._send_json(500, {'error': f'Error writing config: {e}'}); return
@@ -1154,6 +1377,17 @@ def main():
                        help='Run pattern processes as daemons')
 
     args = parser.parse_args()
+    start_frame_logging()
+
+    # Start subprocesses from a fork server instead of forking this process,
+    # which by then holds numpy, the HTTP server thread and the run-mode state.
+    # Must happen before any Process, Pipe or FrameExchange is created.
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        multiprocessing.set_start_method('forkserver', force=True)
+        # The fork server imports these once, so each pattern process starts
+        # with them already loaded instead of importing numpy on its own
+        multiprocessing.set_forkserver_preload(
+            ['numpy', 'frame_exchange', 'pattern_runner', 'pattern_driver'])
 
     # Mode persistence and HTTP server (started ONCE, reused across all mode transitions)
     if args.mode is not None:
@@ -1197,31 +1431,36 @@ def main():
         print(f"Loaded {len(patterns)} patterns: {', '.join(pattern_descriptions)}")
         print(f"Frame interval: {frame_interval*1000:.1f}ms")
 
-        # Create pattern driver process and pipe
-        driver_parent_conn, driver_child_conn = multiprocessing.Pipe()
+        # Deferred until here so startup and configure mode don't pay for numpy
+        import numpy as np
+        from frame_exchange import FrameExchange
+
+        # Shared frame buffers: one row per pattern process
+        exchange = FrameExchange(len(patterns))
+
+        # Create pattern driver process
         driver_process = multiprocessing.Process(
             target=pattern_driver_process,
-            args=(driver_child_conn,),
+            args=(exchange,),
             name="PatternDriver"
         )
 
         if args.daemon:
             driver_process.daemon = True
 
-        # Create processes and pipes for each pattern
-        processes = []
-        pipes = []
+        # Create processes for each pattern, kept as parallel lists indexed alike
+        procs = []          # multiprocessing.Process
+        proc_names = []     # pattern class name
+        proc_channels = []  # input channel
+        proc_ids = []       # process_id, also its FrameExchange row
         for i, pattern_config in enumerate(patterns):
             try:
                 pattern_name = pattern_config['pattern']
                 input_channel = pattern_config['input_channel']
 
-                # Create bidirectional pipe for communication
-                parent_conn, child_conn = multiprocessing.Pipe()
-
                 process = multiprocessing.Process(
                     target=pattern_process,
-                    args=(pattern_name, i, child_conn),
+                    args=(pattern_name, i, exchange),
                     name=f"Pattern-{i}-{pattern_name}"
                 )
 
@@ -1229,15 +1468,16 @@ def main():
                 if args.daemon:
                     process.daemon = True
 
-                # Store process info with input channel for filtering
-                processes.append((process, pattern_name, input_channel, i))
-                pipes.append(parent_conn)
+                procs.append(process)
+                proc_names.append(pattern_name)
+                proc_channels.append(input_channel)
+                proc_ids.append(i)
 
             except Exception as e:
                 print(f"Error creating process for pattern {pattern_config['pattern']}: {str(e)}")
                 continue
 
-        if not processes:
+        if not procs:
             print("No processes could be created")
             sys.exit(1)
 
@@ -1251,8 +1491,8 @@ def main():
             sys.exit(1)
 
         # Start all pattern processes
-        print(f"\nStarting {len(processes)} pattern processes...")
-        for process, pattern_name, process_id, idx in processes:
+        print(f"\nStarting {len(procs)} pattern processes...")
+        for process, pattern_name, process_id in zip(procs, proc_names, proc_ids):
             try:
                 print("Starting pattern process\n")
                 process.start()
@@ -1263,14 +1503,22 @@ def main():
         if args.daemon:
             print("Running pattern processes as daemons")
 
+        # Give the main loop its own core. Done after the children have
+        # started so they don't inherit this mask.
+        _pin_to_cpu(MAIN_CPU, "Main process")
+
         # Initialize pipe reader for hardware input
         pipe_reader = PipeReader('/tmp/beertap_pipe')
         pipe_opened = pipe_reader.open_pipe()
+        # Slot in pipe_reader.values feeding each pattern process, by process_id
+        input_indices = pipe_reader.channel_indices(channels)
 
         # Store handles so stop_run_mode() can shut them down on a mode switch
-        app_state.store_run_handles(driver_process, driver_parent_conn, processes, pipes)
+        app_state.store_run_handles(driver_process, procs, exchange)
 
         pending_mode = None
+        frame_clock = FrameClock(frame_interval)
+        _prepare_gc_for_frame_loop()
 
         try:
             # Main frame generation loop with configurable timing
@@ -1281,9 +1529,46 @@ def main():
                 print("Using default input value 0.0 (no hardware pipe available)")
 
             frame_number = 0
+            # Only used when the driver isn't running; AppState takes a copy
+            final_result = np.zeros(36, dtype=np.float32)
+            sentinels = [process.sentinel for process in procs if process.pid is not None]
+            sentinels.append(driver_process.sentinel)
+
+            # Set once a frame's rows are complete; the frame is published at
+            # the start of the next iteration, before its rows are reused
+            frame_pending = False
+            handed_to_driver = False
+            # Set when the driver misses FRAME_RESULT_TIMEOUT: it may still be
+            # reducing the rows, so it isn't handed another frame until it
+            # signals or exits
+            driver_busy = False
 
             while True:
-                frame_start = time.time()
+
+                # Publish the previous frame. The driver reduced it while this
+                # process slept, so this normally doesn't block. If the driver
+                # isn't running (or timed out), sum the rows here so the web UI
+                # still shows the frame.
+                if frame_pending:
+                    frame_pending = False
+                    if handed_to_driver and exchange.wait_for_driver(FRAME_RESULT_TIMEOUT):
+                        published = exchange.final
+                    else:
+                        if handed_to_driver:
+                            driver_busy = True
+                            log.warning("Pattern driver didn't finish a frame within %.1fs; waiting for it before the next frame",
+                                        FRAME_RESULT_TIMEOUT)
+                        exchange.reduce(final_result)
+                        published = final_result
+
+                    # Store frame data in shared state for HTTP /nozzles endpoint
+                    app_state.update_latest_frame(published)
+
+                    frame_number += 1
+                    # Log status every 100 frames; skip the min/max reductions when INFO is off
+                    if frame_number % 100 == 0 and log.isEnabledFor(logging.INFO):
+                        log.info("Main process - Frame %d: Summed %d results, range [%.3f, %.3f]",
+                                 frame_number, np.count_nonzero(exchange.valid), published.min(), published.max())
 
                 # Read all channel values from hardware pipe
                 pipe_reader.read_latest_values()
@@ -1292,51 +1577,50 @@ def main():
                 _input_source = app_state.get_input_source()
                 _mock_inputs = app_state.get_mock_inputs() if _input_source == 'mock' else None
 
-                # Send frame request to all pattern processes with channel-specific values
-                for i, (process, pattern_name, input_channel, process_id) in enumerate(processes):
-                    try:
-                        # Get the input value for this pattern's specific channel
-                        if _mock_inputs is not None:
-                            input_value = _mock_inputs.get(input_channel, 0.0)
-                        else:
-                            input_value = pipe_reader.get_channel_value(input_channel)
-                        pipes[i].send(('start_frame', input_value))
-                    except Exception as e:
-                        print(f"Error sending frame request to process {i} ({pattern_name}): {str(e)}")
-
-                # Collect results from all pattern processes
-                results = []
-                for i, pipe in enumerate(pipes):
-                    try:
-                        result = pipe.recv()
-                        results.append(result)
-                    except Exception as e:
-                        print(f"Error receiving result from process {i}: {str(e)}")
-                        results.append(None)
-
-                # Sum all valid results and clamp to [-1.0, 1.0]
-                valid_results = [r for r in results if r is not None]
-                if valid_results:
-                    # Sum all arrays element-wise
-                    summed_result = np.sum(valid_results, axis=0)
-                    # Clamp values to [-1.0, 1.0] range
-                    final_result = np.clip(summed_result, -1.0, 1.0)
-                else:
-                    # If no valid results, create zero array
-                    final_result = np.zeros(36, dtype=np.float64)
-
-                # Send final result to pattern driver process
-                try:
-                    driver_parent_conn.send(('frame_data', final_result))
-                except Exception as e:
-                    print(f"Error sending frame data to pattern driver: {str(e)}")
-
-                # Store frame data in shared state for HTTP /nozzles endpoint
-                app_state.update_latest_frame(final_result)
+                # Find processes that have exited (one poll over all sentinels)
+                # so the frame doesn't wait on processes that can never answer
+                exited = multiprocessing.connection.wait(sentinels, timeout=0)
 
-                frame_number += 1
-                if frame_number % 100 == 0:  # Print status every 100 frames
-                    print(f"Main process - Frame {frame_number}: Summed {len(valid_results)} results, range [{final_result.min():.3f}, {final_result.max():.3f}]")
+                # Starting a frame clears the row mask, which a driver that timed
+                # out may still be reading, so skip frames until it's done
+                if driver_busy:
+                    if driver_process.sentinel in exited or exchange.wait_for_driver(0):
+                        driver_busy = False
+                    else:
+                        pending_mode = app_state.wait_for_transition_request(timeout=0)
+                        if pending_mode and pending_mode != 'run':
+                            print(f"Mode switch requested: run -> {pending_mode}")
+                            break
+                        frame_clock.wait()
+                        continue
+
+                # Write every pattern's channel-specific input (hardware values
+                # in one gather, no per-channel lookups), then start the live
+                # ones. A process still busy with an earlier frame isn't
+                # started again until it publishes.
+                exchange.begin_frame()
+                if _mock_inputs is not None:
+                    for input_channel, process_id in zip(proc_channels, proc_ids):
+                        exchange.inputs[process_id] = _mock_inputs.get(input_channel, 0.0)
+                else:
+                    np.take(pipe_reader.values, input_indices, out=exchange.inputs)
+                started = [process_id for process, process_id in zip(procs, proc_ids)
+                           if process.pid is not None and process.sentinel not in exited]
+                started = exchange.start_frame(started)
+                requests_sent = len(started)
+
+                # Wait for the pattern processes to publish into shared memory
+                # frame_start_ns was set when this frame began; reuse it instead of reading the clock
+                received = exchange.wait_for_frames(started, frame_clock.frame_start_ns + FRAME_RESULT_TIMEOUT_NS)
+                if received < requests_sent:
+                    log.warning("Only %d of %d pattern processes returned a frame", received, requests_sent)
+
+                # Hand the rows to the pattern driver, which sums, clamps and
+                # sends them itself without this process waiting on it
+                handed_to_driver = driver_process.sentinel not in exited
+                if handed_to_driver:
+                    exchange.hand_to_driver()
+                frame_pending = True
 
                 # Check for a mode-switch request from the web UI
                 pending_mode = app_state.wait_for_transition_request(timeout=0)
@@ -1345,10 +1629,7 @@ def main():
                     break
 
                 # Maintain configured timing
-                frame_duration = time.time() - frame_start
-                sleep_time = max(0, frame_interval - frame_duration)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                frame_clock.wait()
 
         except KeyboardInterrupt:
             print(f"\nShutting down all processes...")
@@ -1356,30 +1637,8 @@ def main():
             # Close hardware pipe reader
             pipe_reader.close_pipe()
 
-            # Send shutdown signal to pattern driver
-            try:
-                driver_parent_conn.send('shutdown')
-            except:
-                pass
-
-            # Send shutdown signal to all pattern processes
-            for i, pipe in enumerate(pipes):
-                try:
-                    pipe.send('shutdown')
-                except:
-                    pass  # Pipe might already be closed
-
-            # Close all pipes
-            try:
-                driver_parent_conn.close()
-            except:
-                pass
-
-            for pipe in pipes:
-                try:
-                    pipe.close()
-                except:
-                    pass
+            # Send shutdown signal to the pattern driver and all pattern processes
+            exchange.shutdown()
 
             # Terminate pattern driver process
             if driver_process.is_alive():
@@ -1387,7 +1646,7 @@ def main():
                 driver_process.terminate()
 
             # Terminate all pattern processes
-            for process, pattern_name, input_channel, process_id in processes:
+            for process, pattern_name, process_id in zip(procs, proc_names, proc_ids):
                 if process.is_alive():
                     print(f"Terminating process {process_id} ({pattern_name})...")
                     process.terminate()
@@ -1401,7 +1660,7 @@ def main():
                     driver_process.join()
 
             # Wait for pattern processes to terminate
-            for process, pattern_name, input_channel, process_id in processes:
+            for process, pattern_name, process_id in zip(procs, proc_names, proc_ids):
                 if process.is_alive():
                     process.join(timeout=5)
 
@@ -1412,6 +1671,8 @@ def main():
 
             print("All processes terminated")
             return  # Ctrl+C path exits here; fall-through only on mode switch
+        finally:
+            frame_clock.close()
 
         # --- Mode-switch path: frame loop exited via break (not Ctrl+C) ---
         if pending_mode:
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+ADC Pipe Message Format
+
+Shared wire format for the named pipe that adc_reader.py writes and
+BirdBathController.py / pipe_reader_test.py read. Each message is a fixed
+5-byte frame:
+
+    [1 byte: channel id, the channel's index in CHANNEL_NAMES]
+    [4 bytes: big-endian float32 value in [-1.0, 1.0]]
+
+There is no length header; readers consume the pipe FRAME.size bytes at a
+time. Each write is far below PIPE_BUF, so frames from several writers never
+interleave.
+
+Usage:
+    from adc_message import CHANNEL_NAMES, FRAME, encode_message
+
+    # Writer
+    os.write(fd, encode_message('tap1', 0.5))
+
+    # Reader
+    channel_id, value = FRAME.unpack_from(buffer, 0)
+    print(CHANNEL_NAMES[channel_id], value)
+"""
+
+import struct
+
+
+# Channel registration table. A channel's id on the wire is its index here,
+# so writers and readers must share this order: only ever append to it.
+CHANNEL_NAMES = ('tap1', 'tap2', 'tap3', 'tap4', 'tap5', 'tap6')
+
+CHANNEL_IDS = {name: i for i, name in enumerate(CHANNEL_NAMES)}
+
+FRAME = struct.Struct('>Bf')
+
+
+def encode_message(channel: str, value: float) -> bytes:
+    """
+    Build one pipe frame.
+
+    Args:
+        channel (str): Channel name, must be listed in CHANNEL_NAMES
+        value (float): Calibrated value in [-1.0, 1.0]
+
+    Returns:
+        bytes: FRAME.size bytes
+
+    Raises:
+        ValueError: If the channel is not registered
+    """
+    try:
+        channel_id = CHANNEL_IDS[channel]
+    except KeyError:
+        raise ValueError(f"Unknown ADC channel '{channel}' (expected one of {', '.join(CHANNEL_NAMES)})") from None
+    return FRAME.pack(channel_id, value)
@@ -5,28 +5,74 @@ Reads from a single controller with two differential channels
 Sends calibrated values (-1.0 to 1.0) to a named pipe
 """
 
-import pickle
 import argparse
 import time
 import os
 import sys
-import struct
-import fcntl
 import errno
+import itertools
+import json
 import math
+from array import array
 
 from i2c_lock import I2CLock, I2CDeviceInUseError
+from adc_message import CHANNEL_IDS, FRAME
 
 # Hardware-specific imports only when not in test mode
 TEST_MODE = False
 
 def import_hardware_modules():
     """Import hardware-specific modules only when needed"""
-    global board, busio, ADS, AnalogIn
-    import board
-    import busio
-    import adafruit_ads1x15.ads1115 as ADS
-    from adafruit_ads1x15.analog_in import AnalogIn
+    global ADS1115Sweep
+    from ads1115_smbus import ADS1115Sweep
+
+
+def calibration_coefficients(calibration):
+    """
+    Precompute the linear map from voltage to calibrated value, so each sample
+    is one multiply-add instead of dict lookups and a division.
+
+    Maps [min_voltage, max_voltage] to [-1.0, 1.0]:
+        output = 2 * ((input - min) / (max - min)) - 1 = input * scale + bias
+
+    Args:
+        calibration: Dict with min_voltage and max_voltage
+
+    Returns:
+        (scale, bias) tuple. A calibration with min_voltage == max_voltage
+        gives (0.0, 0.0), so every reading calibrates to 0.0.
+    """
+    min_v = calibration['min_voltage']
+    max_v = calibration['max_voltage']
+    if max_v == min_v:
+        return 0.0, 0.0  # Avoid division by zero
+    scale = 2.0 / (max_v - min_v)
+    return scale, -1.0 - min_v * scale
+
+
+# One period of sin() sampled at 1024 points, shared by all mock channels.
+# Nearest-entry lookup (no interpolation) is plenty for fake data.
+SINE_LUT_SIZE = 1024  # Must be a power of two, see MockChannel.voltage
+SINE_LUT = array('d', [math.sin(2 * math.pi * i / SINE_LUT_SIZE) for i in range(SINE_LUT_SIZE)])
+
+
+class ReaderChannel:
+    """One configured channel: its ADC input plus everything the read loop needs, resolved once"""
+
+    __slots__ = ('name', 'channel_id', 'channel', 'calibration', 'scale', 'bias')
+
+    def __init__(self, name, channel, calibration):
+        """
+        Args:
+            name: Channel name, registered in adc_message.CHANNEL_NAMES
+            channel: Object with a voltage property (SweepChannel or MockAnalogIn)
+            calibration: Dict with min_voltage and max_voltage
+        """
+        self.name = name
+        self.channel_id = CHANNEL_IDS[name]
+        self.channel = channel
+        self.calibration = calibration
+        self.scale, self.bias = calibration_coefficients(calibration)
 
 
 class MockChannel:
@@ -45,18 +91,23 @@ class MockChannel:
         self.amplitude = amplitude
         self.offset = offset
         self.start_time = time.time()
+        self._last_voltage = None
 
     @property
     def voltage(self):
         """Generate sine wave voltage based on current time"""
         current_time = time.time() - self.start_time
-        sine_value = math.sin(2 * math.pi * self.frequency * current_time)
-        return self.offset + self.amplitude * sine_value
+        # Phase in LUT entries; the mask wraps it to one period (LUT size is a power of two)
+        index = int(current_time * self.frequency * SINE_LUT_SIZE) & (SINE_LUT_SIZE - 1)
+        self._last_voltage = self.offset + self.amplitude * SINE_LUT[index]
+        return self._last_voltage
 
     @property
     def value(self):
         """Raw ADC value (not used in test mode but provided for compatibility)"""
-        return int((self.voltage / 5.0) * 32767)  # Fake 16-bit value
+        # Reuse the sample from the preceding voltage read rather than generating another
+        voltage = self._last_voltage if self._last_voltage is not None else self.voltage
+        return int((voltage / 5.0) * 32767)  # Fake 16-bit value
 
 
 class MockADS:
@@ -104,8 +155,7 @@ class ADCReader:
 
     def load_config(self, config_file):
         """Load configuration from JSON file"""
-        import json  # Keep json for config loading
-        with open(config_file, 'r') as f:
+        with open(config_file, 'rb') as f:
             self.config = json.load(f)
 
         # Validate required fields
@@ -120,6 +170,9 @@ class ADCReader:
                 raise ValueError(f"Missing calibration for channel {channel.get('name', 'unnamed')}")
             if 'min_voltage' not in channel['calibration'] or 'max_voltage' not in channel['calibration']:
                 raise ValueError(f"Calibration must have min_voltage and max_voltage for channel {channel.get('name', 'unnamed')}")
+            # Pipe frames carry a channel id, so the name must be registered
+            if channel.get('name') not in CHANNEL_IDS:
+                raise ValueError(f"Channel {channel.get('name', 'unnamed')} is not listed in adc_message.CHANNEL_NAMES")
 
     def setup_adc(self):
         """Initialize I2C and ADC with configured address (or mock in test mode)"""
@@ -157,47 +210,32 @@ class ADCReader:
                     channel = MockAnalogIn(self.ads, pos_pin, neg_pin)
 
                     # Store channel with its configuration
-                    self.channels.append({
-                        'channel': channel,
-                        'name': ch_config['name'],
-                        'calibration': ch_config['calibration']
-                    })
+                    self.channels.append(ReaderChannel(ch_config['name'], channel, ch_config['calibration']))
 
                 if self.debug:
                     print(f"Mock ADC initialized with {len(self.channels)} channels generating sine wave data")
 
             else:
-                # Real hardware setup - keep original logic
-                # Create I2C bus
-                self.i2c = busio.I2C(board.SCL, board.SDA)
-
-                # Create ADS object with configured address
+                # Real hardware setup
                 # Convert hex string to integer if needed
                 address = self.config['address']
                 if isinstance(address, str):
                     address = int(address, 16)
 
-                self.ads = ADS.ADS1115(self.i2c, address=address)
-
-                # Set gain
-                self.ads.gain = self.config['gain']
+                # Open the ADC on the I2C bus (bus 1 is the Pi's SCL/SDA pins).
+                # The channels are read in config order, each read starting
+                # the next channel's conversion
+                self.i2c = None  # The sweep owns the bus
+                pins = [(ch['positive_pin'], ch['negative_pin']) for ch in self.config['channels']]
+                self.ads = ADS1115Sweep(address, gain=self.config['gain'], pins=pins,
+                                        data_rate=self.config.get('data_rate', 128),
+                                        bus=self.config.get('i2c_bus', 1))
 
                 # Create channel objects
                 self.channels = []
-                for ch_config in self.config['channels']:
-                    # Get positive and negative pins
-                    pos_pin = ch_config['positive_pin']
-                    neg_pin = ch_config['negative_pin']
-
-                    # Create AnalogIn object
-                    channel = AnalogIn(self.ads, pos_pin, neg_pin)
-
+                for ch_config, channel in zip(self.config['channels'], self.ads.channels):
                     # Store channel with its configuration
-                    self.channels.append({
-                        'channel': channel,
-                        'name': ch_config['name'],
-                        'calibration': ch_config['calibration']
-                    })
+                    self.channels.append(ReaderChannel(ch_config['name'], channel, ch_config['calibration']))
 
                 if self.debug:
                     print(f"ADC initialized at address {hex(address)} with {len(self.channels)} channels")
@@ -224,86 +262,65 @@ class ADCReader:
         elif self.debug:
             print(f"Using existing named pipe: {self.pipe_path}")
 
-    def calibrate_value(self, voltage, calibration):
-        """
-        Convert voltage to calibrated value between -1.0 and 1.0
+        # Write end of the pipe, opened once a reader is connected and kept
+        # open for as long as that reader stays
+        self.pipe_fd = None
 
-        Args:
-            voltage: Raw voltage reading from ADC
-            calibration: Dict with min_voltage and max_voltage
+    def open_pipe(self):
+        """
+        Open the write end of the named pipe without blocking.
 
         Returns:
-            Float value between -1.0 and 1.0 (clamped to this range)
+            bool: True if the pipe is open, False if there is no reader yet
         """
-        min_v = calibration['min_voltage']
-        max_v = calibration['max_voltage']
-
-        # Map from [min_v, max_v] to [-1.0, 1.0]
-        # Formula: output = 2 * ((input - min) / (max - min)) - 1
-        if max_v != min_v:
-            normalized = (voltage - min_v) / (max_v - min_v)  # 0 to 1
-            calibrated = 2.0 * normalized - 1.0  # -1 to 1
-        else:
-            calibrated = 0.0  # Avoid division by zero
-
-        # Clamp output to exactly -1.0 to 1.0 range
-        # This ensures values outside the calibration range don't exceed bounds
-        calibrated = max(-1.0, min(1.0, calibrated))
+        try:
+            self.pipe_fd = os.open(self.pipe_path, os.O_WRONLY | os.O_NONBLOCK)
+            return True
+        except OSError as e:
+            # ENXIO: no reader on the other end, that's okay
+            if e.errno == errno.ENXIO:
+                if self.debug:
+                    print(f"No reader connected to {self.pipe_path}, dropping data")
+            else:
+                print(f"Problem opening pipe {e}")
+            return False
 
-        return calibrated
+    def close_pipe(self):
+        """Close the write end of the named pipe, if open."""
+        if self.pipe_fd is not None:
+            os.close(self.pipe_fd)
+            self.pipe_fd = None
 
-    def send_to_pipe(self, channel_name, value):
+    def send_to_pipe(self, frames):
         """
-        Send a pickled Python object through a named pipe
+        Send one read cycle's readings through a named pipe as back-to-back
+        fixed-size frames (see adc_message.py), in a single write.
 
-        The object contains:
-        - channel: String identifier for the channel
+        Each frame contains:
+        - channel id: Index of the channel name in adc_message.CHANNEL_NAMES
         - value: Float between -1.0 and 1.0
-        - timestamp: Unix timestamp
 
-        Uses file locking to ensure atomic writes with multiple writers
-        """
-        data = {
-            'channel': channel_name,
-            'value': value,
-            'timestamp': time.time()
-        }
+        The pipe stays open between calls, so each cycle costs one write.
+        No locking is needed with multiple writers: pipe writes of up to
+        PIPE_BUF bytes are atomic, and a cycle is only a few frames.
 
-        # print(data)
-
-        # Pickle the object
-        pickled_data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
-
-        # Prepend with length of message (4 bytes, big-endian)
-        length = len(pickled_data)
-        message = struct.pack('>I', length) + pickled_data
+        Args:
+            frames: Bytes-like object holding the cycle's packed frames
+        """
+        if self.pipe_fd is None and not self.open_pipe():
+            return
 
         try:
-            # Open pipe with O_WRONLY to avoid blocking if no reader
-            fd = os.open(self.pipe_path, os.O_WRONLY | os.O_NONBLOCK)
-
-            # Use file locking to ensure atomic write
-            # XXX when running in test mode on mac, I can't use this type of locking
-            # Since test mode (currently, at least) has only one writer it should be
-            # safe not to lock.
-            if not self.test_mode:
-                fcntl.flock(fd, fcntl.LOCK_EX)
-            try:
-                # Write the complete message atomically
-                os.write(fd, message)
-            finally:
-                if not self.test_mode:
-                    fcntl.flock(fd, fcntl.LOCK_UN)
-                os.close(fd)
-
-        except (BrokenPipeError, OSError) as e:
-            # No reader on the other end, that's okay
-            if isinstance(e, OSError) and e.errno == errno.ENXIO:
-                if self.debug:
-                    print(f"No reader connected to {self.pipe_path}, dropping data")
-            else:
+            os.write(self.pipe_fd, frames)
+        except BlockingIOError:
+            # Pipe is full because the reader isn't draining it; drop this sample
+            if self.debug:
+                print(f"Pipe {self.pipe_path} is full, dropping data")
+        except OSError as e:
+            # Reader went away (EPIPE) or the pipe broke; reopen on the next sample
+            if not isinstance(e, BrokenPipeError):
                 print(f"Problem sending to pipe {e}")
-            # pass
+            self.close_pipe()
 
     def run(self):
         """Main loop - read ADC values and send to pipes"""
@@ -312,53 +329,77 @@ class ADCReader:
             print(f"\nStarting ADC reader in {mode_str} with {self.config['read_interval']}s interval")
             print("Press Ctrl+C to stop\n")
 
-        reading_count = 1
-        last_debug_time = time.time()
-        debug_interval = 1.0  # Print debug info once per second max
+        last_debug_ns = time.monotonic_ns()
+        debug_interval_ns = 1_000_000_000  # Print debug info once per second max
+        show_debug = False  # Whether this cycle's readings get printed
+
+        # Cycles are paced against absolute deadlines on the monotonic clock,
+        # so wall clock steps don't disturb the cadence and a late cycle is
+        # made up by the next sleep rather than shifting every later sample
+        interval_ns = round(self.config['read_interval'] * 1_000_000_000)
+        next_deadline_ns = time.monotonic_ns()
+
+        # Resolve everything the loop touches once, up front, so each cycle
+        # works on locals instead of repeating attribute and dict lookups.
+        # Each channel is a flat tuple the loop unpacks straight into locals
+        frame_size = FRAME.size
+        channels = tuple((i * frame_size, ch.channel_id, ch.name, ch.channel, ch.scale, ch.bias)
+                         for i, ch in enumerate(self.channels))
+        send_to_pipe = self.send_to_pipe
+
+        # Each cycle's frames are packed in place into this one buffer, each
+        # channel at its own offset, so a cycle allocates no message objects
+        frame_buf = bytearray(frame_size * len(channels))
+        pack_frame = FRAME.pack_into
+        debug = self.debug
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
 
         try:
-            while True:
-                # Record start time of read cycle
-                cycle_start = time.time()
-
+            for reading_count in itertools.count(1):
                 # Read each channel
-                for i, ch_info in enumerate(self.channels):
-                    channel = ch_info['channel']
-                    name = ch_info['name']
-                    calibration = ch_info['calibration']
-
+                for offset, channel_id, name, channel, scale, bias in channels:
                     # Get voltage reading
                     voltage = channel.voltage
-                    raw_value = channel.value
 
-                    # Calibrate to -1.0 to 1.0 range
-                    calibrated_value = self.calibrate_value(voltage, calibration)
+                    # Calibrate to -1.0 to 1.0 range, clamped so values outside
+                    # the calibration range don't exceed bounds
+                    calibrated_value = max(-1.0, min(1.0, voltage * scale + bias))
 
                     # Print status only in debug mode and at controlled rate
-                    if self.debug and (time.time() - last_debug_time >= debug_interval):
-                        print(f"[{reading_count:4d}] {name}: {voltage:.4f}V -> {calibrated_value:+.4f}")
-
-                    # Send to the shared pipe
-                    self.send_to_pipe(name, calibrated_value)
-
-                # Update debug timing
-                if self.debug and (time.time() - last_debug_time >= debug_interval):
-                    last_debug_time = time.time()
-
-                # Calculate how long the reads took
-                cycle_duration = time.time() - cycle_start
-
-                # Sleep for the remaining time to maintain the desired interval
-                sleep_time = self.config['read_interval'] - cycle_duration
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    if show_debug:
+                        # The raw reading is only wanted here; don't fetch it on other cycles
+                        print(f"[{reading_count:4d}] {name}: {voltage:.4f}V (raw {channel.value}) -> {calibrated_value:+.4f}")
+
+                    pack_frame(frame_buf, offset, channel_id, calibrated_value)
+
+                # Send the whole cycle to the shared pipe
+                send_to_pipe(frame_buf)
+
+                # One clock read per cycle serves both the schedule and the debug throttle
+                now_ns = monotonic_ns()
+
+                # Decide whether the next cycle's readings get printed
+                if debug:
+                    show_debug = now_ns - last_debug_ns >= debug_interval_ns
+                    if show_debug:
+                        last_debug_ns = now_ns
+
+                # Sleep until the next deadline to maintain the desired interval
+                next_deadline_ns += interval_ns
+                remaining_ns = next_deadline_ns - now_ns
+                if remaining_ns > 0:
+                    sleep(remaining_ns / 1_000_000_000)
+                elif remaining_ns < -interval_ns:
+                    # More than a whole cycle behind (e.g. a stalled read): restart
+                    # the schedule from now instead of reading back to back to catch up
+                    next_deadline_ns -= remaining_ns
                 # If reads took longer than the interval, no sleep (continuous reading)
 
-                reading_count += 1
-
         except KeyboardInterrupt:
             if self.debug:
                 print("\nADC reader stopped")
+            self.close_pipe()
         except Exception as e:
             print(f"Error in main loop: {e}", file=sys.stderr)
             sys.exit(1)
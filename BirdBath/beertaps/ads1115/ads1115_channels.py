@@ -5,8 +5,14 @@ Shows what's actually happening in the chip
 """
 
 import smbus2
+from smbus2 import i2c_msg
+import struct
 import time
 
+# Register contents are big-endian; the conversion register is signed
+_unpack_i16be = struct.Struct('>h').unpack
+_unpack_u16be = struct.Struct('>H').unpack
+
 class ADS1115:
     # ADS1115 registers
     REG_CONVERSION = 0x00
@@ -25,6 +31,10 @@ class ADS1115:
     CONFIG_COMP_LAT_MASK = 0x0004
     CONFIG_COMP_QUE_MASK = 0x0003
 
+    # Config register field values
+    CONFIG_MODE_CONTINUOUS = 0x0000   # MODE bit clear: continuous conversion
+    CONFIG_COMP_QUE_1 = 0x0000        # Comparator on, assert ALERT/RDY after one conversion
+
     # Lookup tables for config decoding
     MUX_CONFIGS = {
         0x0000: "Differential: AIN0 - AIN1",
@@ -46,6 +56,9 @@ class ADS1115:
         0x0A00: ("±0.256V", "16x", 0.256)
     }
 
+    # Full-scale voltage for each 3-bit PGA field value; 110 and 111 are both +/-0.256V
+    PGA_FULL_SCALE = (6.144, 4.096, 2.048, 1.024, 0.512, 0.256, 0.256, 0.256)
+
     DATA_RATES = {
         0x0000: "8 SPS",
         0x0020: "16 SPS",
@@ -57,6 +70,9 @@ class ADS1115:
         0x00E0: "860 SPS"
     }
 
+    # Samples per second for each DR setting
+    DATA_RATE_SPS = {dr: int(desc.split()[0]) for dr, desc in DATA_RATES.items()}
+
     COMP_QUEUE = {
         0x0000: "1 conversion",
         0x0001: "2 conversions",
@@ -64,18 +80,68 @@ class ADS1115:
         0x0003: "Disabled"
     }
 
+    # Longest we poll for a single-shot conversion; 8 SPS takes 125ms
+    CONVERSION_TIMEOUT = 0.2
+
     def __init__(self, bus=1, address=0x48):
         self.bus = smbus2.SMBus(bus)
         self.address = address
+        # Full-scale voltage of the configure_continuous() setting
+        self.continuous_range = None
+
+    def read_register(self, register):
+        """
+        Read a 16-bit register as one combined I2C transaction: the pointer
+        write and the 2-byte read are joined by a repeated start.
+
+        Returns:
+            bytes: The register's two bytes, high byte first
+        """
+        write = i2c_msg.write(self.address, [register])
+        read = i2c_msg.read(self.address, 2)
+        self.bus.i2c_rdwr(write, read)
+        return bytes(read)
+
+    def write_register(self, register, value):
+        """Write a 16-bit register (pointer byte plus two data bytes) in one transaction."""
+        self.bus.i2c_rdwr(i2c_msg.write(self.address, [register, (value >> 8) & 0xFF, value & 0xFF]))
 
     def read_config(self):
         """Read and decode the configuration register"""
-        config_bytes = self.bus.read_i2c_block_data(self.address, self.REG_CONFIG, 2)
-        config_val = (config_bytes[0] << 8) | config_bytes[1]
+        config_val, = _unpack_u16be(self.read_register(self.REG_CONFIG))
         return config_val
 
-    def decode_config(self, config_val):
-        """Decode configuration register into human-readable format"""
+    def wait_for_conversion(self):
+        """
+        Poll the config register until the OS bit reads 1 (no conversion in
+        progress), instead of sleeping for the slowest data rate.
+
+        Returns:
+            int: The config register value read when the conversion finished
+
+        Raises:
+            TimeoutError: If the conversion doesn't finish within CONVERSION_TIMEOUT
+        """
+        deadline = time.monotonic() + self.CONVERSION_TIMEOUT
+        while True:
+            config_val = self.read_config()
+            if config_val & self.CONFIG_OS_MASK:
+                return config_val
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"ADS1115 at {hex(self.address)} did not finish converting")
+
+    def decode_config(self, config_val, verbose=False):
+        """
+        Get the full-scale voltage range from a configuration register value,
+        and with verbose, print the whole register in human-readable format.
+
+        Returns:
+            float: Full-scale voltage for the register's PGA setting
+        """
+        voltage_range = self.PGA_FULL_SCALE[(config_val >> 9) & 0x7]
+        if not verbose:
+            return voltage_range
+
         print(f"\nConfiguration Register: 0x{config_val:04X}")
         print("=" * 50)
 
@@ -91,11 +157,10 @@ class ADS1115:
         # Programmable Gain Amplifier
         pga_val = config_val & self.CONFIG_PGA_MASK
         if pga_val in self.PGA_CONFIGS:
-            range_str, gain_str, voltage_range = self.PGA_CONFIGS[pga_val]
+            range_str, gain_str, _ = self.PGA_CONFIGS[pga_val]
             print(f"PGA (Gain): {range_str} (Gain {gain_str})")
         else:
-            print(f"PGA (Gain): Unknown (0x{pga_val:04X})")
-            voltage_range = 2.048  # default
+            print(f"PGA (Gain): ±{voltage_range}V (0x{pga_val:04X})")
 
         # Operating mode
         mode_bit = config_val & self.CONFIG_MODE_MASK
@@ -125,8 +190,8 @@ class ADS1115:
 
         return voltage_range
 
-    def set_channel_and_read(self, channel=0, gain=0x0400):
-        """Set channel configuration and read value"""
+    def set_channel_and_read(self, channel=0, gain=0x0400, verbose=False):
+        """Set channel configuration and read value; verbose prints the config and result"""
         if channel < 0 or channel > 3:
             raise ValueError("Channel must be 0-3")
 
@@ -141,38 +206,86 @@ class ADS1115:
                   0x0080 |      # 128 SPS
                   0x0003)       # Disable comparator
 
-        print(f"\nSetting up channel A{channel}:")
-        print(f"Writing config: 0x{config:04X}")
+        if verbose:
+            print(f"\nSetting up channel A{channel}:")
+            print(f"Writing config: 0x{config:04X}")
 
         # Write configuration
-        config_bytes = [(config >> 8) & 0xFF, config & 0xFF]
-        self.bus.write_i2c_block_data(self.address, self.REG_CONFIG, config_bytes)
+        self.write_register(self.REG_CONFIG, config)
 
-        # Read back and decode what we just wrote
-        actual_config = self.read_config()
-        voltage_range = self.decode_config(actual_config)
+        # Wait for conversion. The register value that ends the poll is the
+        # config the chip actually used, so decode that instead of reading it back
+        # again (OS reads 1 here: conversion complete)
+        actual_config = self.wait_for_conversion()
+        voltage_range = self.decode_config(actual_config, verbose)
 
-        # Wait for conversion
-        time.sleep(0.01)
-
-        # Read conversion result
-        result = self.bus.read_i2c_block_data(self.address, self.REG_CONVERSION, 2)
-        raw_value = (result[0] << 8) | result[1]
-
-        # Convert to signed
-        if raw_value > 32767:
-            raw_value -= 65536
+        # Read conversion result (signed 16-bit)
+        result = self.read_register(self.REG_CONVERSION)
+        raw_value, = _unpack_i16be(result)
 
         # Convert to voltage
         voltage = (raw_value * voltage_range) / 32767.0
 
-        print(f"\nConversion Result:")
-        print(f"Raw bytes: 0x{result[0]:02X} 0x{result[1]:02X}")
-        print(f"Raw value: {raw_value}")
-        print(f"Voltage: {voltage:.6f}V")
+        if verbose:
+            print(f"\nConversion Result:")
+            print(f"Raw bytes: 0x{result[0]:02X} 0x{result[1]:02X}")
+            print(f"Raw value: {raw_value}")
+            print(f"Voltage: {voltage:.6f}V")
 
         return raw_value, voltage
 
+    def configure_continuous(self, channel=0, gain=0x0400, data_rate=0x00E0):
+        """
+        Put the chip in continuous-conversion mode on one channel, so it
+        converts on its own at the configured data rate and each sample
+        afterwards is a single conversion-register read (read_conversion())
+        with no config write.
+
+        Also sets the threshold registers to the datasheet's conversion-ready
+        values (Hi_thresh MSB 1, Lo_thresh MSB 0) so ALERT/RDY pulses after
+        every conversion, for a host that has the pin wired to a GPIO. The
+        pin isn't wired on the beertaps boards, so callers here pace their
+        reads at the data rate instead.
+
+        Args:
+            channel: Single-ended input 0-3
+            gain: PGA bits, one of the PGA_CONFIGS keys
+            data_rate: DR bits, one of the DATA_RATES keys
+
+        Returns:
+            int: Samples per second the chip will produce
+        """
+        if channel < 0 or channel > 3:
+            raise ValueError("Channel must be 0-3")
+
+        self.write_register(self.REG_HI_THRESH, 0x8000)
+        self.write_register(self.REG_LO_THRESH, 0x0000)
+
+        config = (0x4000 + (channel << 12) |  # Channel selection
+                  gain |                      # Gain setting
+                  self.CONFIG_MODE_CONTINUOUS |
+                  data_rate |                 # Data rate
+                  self.CONFIG_COMP_QUE_1)
+        self.write_register(self.REG_CONFIG, config)
+
+        self.continuous_range = self.PGA_CONFIGS[gain][2]
+        return self.DATA_RATE_SPS[data_rate]
+
+    def read_conversion(self):
+        """
+        Read the latest sample after configure_continuous().
+
+        Returns:
+            (raw_value, voltage) tuple
+
+        Raises:
+            RuntimeError: If configure_continuous() hasn't been called
+        """
+        if self.continuous_range is None:
+            raise RuntimeError("read_conversion() needs configure_continuous() first")
+        raw_value, = _unpack_i16be(self.read_register(self.REG_CONVERSION))
+        return raw_value, (raw_value * self.continuous_range) / 32767.0
+
     def close(self):
         self.bus.close()
 
@@ -186,7 +299,7 @@ def main():
         # Read initial configuration
         print("Initial configuration:")
         initial_config = ads.read_config()
-        ads.decode_config(initial_config)
+        ads.decode_config(initial_config, verbose=True)
 
         # Test each channel
         for channel in range(4):
@@ -194,7 +307,7 @@ def main():
             print(f"TESTING CHANNEL A{channel}")
             print(f"{'='*60}")
 
-            raw, voltage = ads.set_channel_and_read(channel)
+            raw, voltage = ads.set_channel_and_read(channel, verbose=True)
 
             input(f"\nPress Enter to continue to next channel...")
 
@@ -212,9 +325,24 @@ def main():
 
         for gain_val, gain_desc in gain_settings:
             print(f"\n--- Testing {gain_desc} range ---")
-            raw, voltage = ads.set_channel_and_read(0, gain_val)
+            raw, voltage = ads.set_channel_and_read(0, gain_val, verbose=True)
             input("Press Enter for next gain setting...")
 
+        # Stream channel 0 in continuous mode for one second
+        print(f"\n{'='*60}")
+        print("TESTING CONTINUOUS MODE ON A0")
+        print(f"{'='*60}")
+
+        sps = ads.configure_continuous(0)
+        period = 1.0 / sps
+        count = 0
+        start = time.monotonic()
+        while time.monotonic() - start < 1.0:
+            raw, voltage = ads.read_conversion()
+            count += 1
+            time.sleep(period)
+        print(f"Read {count} samples in 1s at {sps} SPS, last: {raw} ({voltage:.6f}V)")
+
         ads.close()
         print("\nTest completed!")
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+ADS1115 Monitor - print readings from one ADS1115 once a second
+
+Reads single-ended inputs (--channels) and/or differential pairs (--diff).
+With a single input the chip is put in continuous-conversion mode, so each
+reading skips the config write and conversion wait.
+
+Usage:
+    python3 ads1115_monitor.py --addr 0x49 --channels 0
+    python3 ads1115_monitor.py --addr 0x49 --diff 0-1,2-3
+"""
+
+import argparse
+import time
+import board
+import busio
+import adafruit_ads1x15.ads1115 as ADS
+from adafruit_ads1x15.ads1x15 import Mode
+from adafruit_ads1x15.analog_in import AnalogIn
+
+# Adafruit gain setting -> full-scale voltage
+GAINS = {'2/3': (2/3, 6.144), '1': (1, 4.096), '2': (2, 2.048),
+         '4': (4, 1.024), '8': (8, 0.512), '16': (16, 0.256)}
+
+DATA_RATES = (8, 16, 32, 64, 128, 250, 475, 860)
+
+def parse_inputs(channels, diff):
+    """
+    Turn the --channels and --diff strings into (positive, negative) pin pairs.
+
+    Args:
+        channels: Comma-separated single-ended pins, e.g. "0,1", or None
+        diff: Comma-separated differential pairs, e.g. "0-1,2-3", or None
+
+    Returns:
+        list: (positive_pin, negative_pin) tuples; negative_pin is None for single-ended
+    """
+    inputs = []
+    if channels:
+        inputs.extend((int(pin), None) for pin in channels.split(','))
+    if diff:
+        for pair in diff.split(','):
+            pos, neg = pair.split('-')
+            inputs.append((int(pos), int(neg)))
+    return inputs
+
+def monitor(address, gain, inputs, data_rate=128, interval=1.0):
+    """
+    Print a reading of each input every interval seconds until Ctrl+C.
+
+    Args:
+        address: I2C address of the ADS1115
+        gain: One of the GAINS keys
+        inputs: (positive_pin, negative_pin) pairs, as from parse_inputs()
+        data_rate: Samples per second, one of DATA_RATES
+        interval: Seconds between readings
+    """
+    try:
+        # Create I2C bus
+        i2c = busio.I2C(board.SCL, board.SDA)
+
+        # Create ADS object with your specific address
+        ads = ADS.ADS1115(i2c, address=address)
+        ads.gain, full_scale = GAINS[gain]
+        ads.data_rate = data_rate
+
+        # With only one input there's nothing to switch between, so let the
+        # chip convert continuously and skip the config write and conversion
+        # wait on each reading
+        if len(inputs) == 1:
+            ads.mode = Mode.CONTINUOUS
+
+        channels = [AnalogIn(ads, pos) if neg is None else AnalogIn(ads, pos, neg)
+                    for pos, neg in inputs]
+        # Each AnalogIn property access is a full read, so read the raw value
+        # once and scale it the way AnalogIn.voltage does
+        volts_per_count = full_scale / 32767
+
+        names = [f"A{pos}" if neg is None else f"A{pos} - A{neg}" for pos, neg in inputs]
+        print(f"ADS1115 Monitor - Address {hex(address)}, {', '.join(names)}")
+        print(f"Gain: {gain} (±{full_scale}V), {data_rate} SPS")
+        print("Press Ctrl+C to stop\n")
+
+        # Number the readings only when there's more than one input
+        if len(channels) > 1:
+            labels = [f"Reading {chan_id} " for chan_id in range(1, len(channels) + 1)]
+        else:
+            labels = ["Reading "]
+
+        # Take continuous readings
+        reading_count = 1
+        while True:
+            for label, channel in zip(labels, channels):
+                raw_value = channel.value
+                voltage = raw_value * volts_per_count
+                print(f"{label}{reading_count:3d}: {voltage:.4f}V (raw: {raw_value})")
+
+            reading_count += 1
+
+            time.sleep(interval)
+
+    except KeyboardInterrupt:
+        print("\nTest stopped")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print readings from one ADS1115')
+    parser.add_argument('--addr', type=lambda s: int(s, 0), default=0x49,
+                        help='I2C address (default: 0x49)')
+    parser.add_argument('--gain', choices=GAINS.keys(), default='1',
+                        help='Adafruit gain setting (default: 1, ±4.096V)')
+    parser.add_argument('--channels', help='Single-ended inputs, e.g. "0,1"')
+    parser.add_argument('--diff', help='Differential pairs, e.g. "0-1,2-3"')
+    parser.add_argument('--rate', type=int, choices=DATA_RATES, default=128,
+                        help='Samples per second (default: 128)')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Seconds between readings (default: 1.0)')
+    args = parser.parse_args(argv)
+
+    inputs = parse_inputs(args.channels, args.diff)
+    if not inputs:
+        parser.error('give at least one input with --channels or --diff')
+
+    monitor(args.addr, args.gain, inputs, args.rate, args.interval)
+
+if __name__ == "__main__":
+    main()
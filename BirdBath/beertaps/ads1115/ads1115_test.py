@@ -5,44 +5,52 @@ Specifically looks for ADS1115 ADC at common addresses
 """
 
 import smbus2
+import sys
 import time
 
+def probe_address(bus, address):
+    """
+    Check whether a device answers at an I2C address, the way i2cdetect does:
+    an SMBus quick write (address byte only), except in the 0x30-0x37 and
+    0x50-0x5F ranges where quick writes can corrupt EEPROMs, so read a byte.
+
+    Returns:
+        bool: True if a device acknowledged
+    """
+    try:
+        if 0x30 <= address <= 0x37 or 0x50 <= address <= 0x5F:
+            bus.read_byte(address)
+        else:
+            bus.write_quick(address)
+        return True
+    except OSError:
+        return False
+
 def scan_i2c_bus(bus_number=1):
     """
     Scan I2C bus for connected devices
     bus_number: 1 for newer Pi models, 0 for very old ones
     """
     print(f"Scanning I2C bus {bus_number}...")
-    print("     0  1  2  3  4  5  6  7  8  9  a  b  c  d  e  f")
 
     try:
         bus = smbus2.SMBus(bus_number)
-
-        for i in range(0, 128):
-            try:
-                # Try to read from device
-                bus.read_byte(i)
-                if i < 16:
-                    print(f"{i:02x}: {i:02x}", end="")
-                else:
-                    if i % 16 == 0:
-                        print(f"\n{i//16:x}0:", end="")
-                    print(f" {i:02x}", end="")
-            except:
-                if i < 16:
-                    print(f"{i:02x}: --", end="")
-                else:
-                    if i % 16 == 0:
-                        print(f"\n{i//16:x}0:", end="")
-                    print(" --", end="")
-
-        print("\n")
+        # Probe everything first, then print, so printing doesn't slow the scan
+        found = {i for i in range(0, 128) if probe_address(bus, i)}
         bus.close()
 
     except Exception as e:
         print(f"Error accessing I2C bus: {e}")
         return False
 
+    # Build the whole grid, then write it in one go
+    grid = ["     0  1  2  3  4  5  6  7  8  9  a  b  c  d  e  f"]
+    for i in range(0, 128):
+        if i % 16 == 0:
+            grid.append(f"\n{i//16:x}0:")
+        grid.append(f" {i:02x}" if i in found else " --")
+    sys.stdout.write("".join(grid) + "\n\n")
+
     return True
 
 def check_ads1115():
@@ -57,12 +65,10 @@ def check_ads1115():
         found_devices = []
 
         for addr in ads1115_addresses:
-            try:
-                # Try to read from the device
-                bus.read_byte(addr)
+            if probe_address(bus, addr):
                 print(f"✓ Found device at 0x{addr:02X}")
                 found_devices.append(addr)
-            except:
+            else:
                 print(f"✗ No device found at 0x{addr:02X}")
 
         bus.close()
@@ -72,10 +78,14 @@ def check_ads1115():
         print(f"Error checking ADS1115: {e}")
         return []
 
+# busio.I2C bus shared by every communication test, opened on first use
+_i2c = None
+
 def test_ads1115_communication(address):
     """
     Test basic communication with ADS1115
     """
+    global _i2c
     print(f"\nTesting communication with ADS1115 at 0x{address:02X}:")
 
     try:
@@ -83,11 +93,12 @@ def test_ads1115_communication(address):
         import busio
         import adafruit_ads1x15.ads1115 as ADS
 
-        # Create I2C bus
-        i2c = busio.I2C(board.SCL, board.SDA)
+        # Create I2C bus once; each busio.I2C sets up the pins and bus lock again
+        if _i2c is None:
+            _i2c = busio.I2C(board.SCL, board.SDA)
 
         # Create ADS object
-        ads = ADS.ADS1115(i2c, address=address)
+        ads = ADS.ADS1115(_i2c, address=address)
 
         # Try to read from channel 0
         from adafruit_ads1x15.analog_in import AnalogIn
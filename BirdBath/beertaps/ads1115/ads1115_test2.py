@@ -1,27 +1,60 @@
 import smbus2
+from smbus2 import i2c_msg
+import struct
 import time
 
 # Simple quick test
 bus = smbus2.SMBus(1)
 ads_addr = 0x48
 
+# Conversion register: signed 16-bit, big-endian; counts to volts at ±4.096V
+_unpack_i16be = struct.Struct('>h').unpack
+VOLTS_PER_COUNT = 4.096 / 32767
+
+# Register pointer writes and a 2-byte read buffer, reused for every transfer.
+# Each register read is one write + repeated-start + read transaction.
+config_ptr = i2c_msg.write(ads_addr, [1])
+conversion_ptr = i2c_msg.write(ads_addr, [0])
+result = i2c_msg.read(ads_addr, 2)
+
 # Read config to verify communication
-config = bus.read_i2c_block_data(ads_addr, 1, 2)
+bus.i2c_rdwr(config_ptr, result)
+config = list(result)
 print(f'Config register: 0x{config[0]:02X}{config[1]:02X}')
 
-# Test all channels quickly
+# Config writes for each channel, built once.
+# Start conversion, single-ended channel, gain ±4.096V, single-shot, 128 SPS, comparator off
+start_msgs = []
 for ch in range(4):
-    # Set channel (simplified)
     mux = 0x40 + (ch << 4)  # Single-ended channels
-    config_val = 0x8000 | (mux << 8) | 0x0200  # Start conversion, channel, gain
-    bus.write_i2c_block_data(ads_addr, 1, [(config_val >> 8) & 0xFF, config_val & 0xFF])
-    time.sleep(0.01)
+    config_val = 0x8000 | (mux << 8) | 0x0200 | 0x0100 | 0x0083
+    start_msgs.append(i2c_msg.write(ads_addr, [1, (config_val >> 8) & 0xFF, config_val & 0xFF]))
+
+# Test all channels quickly
+for ch, start in enumerate(start_msgs):
+    bus.i2c_rdwr(start)
+
+    # Wait for the conversion: OS (bit 15 of config) reads 1 once it's done
+    deadline = time.monotonic() + 0.2
+    timed_out = False
+    while True:
+        bus.i2c_rdwr(config_ptr, result)
+        if list(result)[0] & 0x80:
+            break
+        if time.monotonic() > deadline:
+            timed_out = True
+            break
+        time.sleep(0.001)
+
+    # The conversion register still holds the previous result
+    if timed_out:
+        print(f'A{ch}: conversion timed out')
+        continue
 
     # Read result
-    result = bus.read_i2c_block_data(ads_addr, 0, 2)
-    raw = (result[0] << 8) | result[1]
-    if raw > 32767: raw -= 65536
-    voltage = (raw * 4.096) / 32767
+    bus.i2c_rdwr(conversion_ptr, result)
+    raw, = _unpack_i16be(bytes(result))
+    voltage = raw * VOLTS_PER_COUNT
     print(f'A{ch}: {voltage:.3f}V (raw: {raw})')
 
 bus.close()
@@ -2,40 +2,66 @@
 """
 ADS1115 Simple Test - Address 0x49, Channel A0
 Focused test for your specific setup
+
+The three chips convert in parallel: each pass starts a conversion on every
+chip, waits one conversion time, then reads all three results back.
 """
 
+import struct
 import time
-import board
-import busio
-import adafruit_ads1x15.ads1115 as ADS
-from adafruit_ads1x15.analog_in import AnalogIn
+import smbus2
+from smbus2 import i2c_msg
+
+ADDRESSES = (0x48, 0x49, 0x4a)
+
+# MUX bits for the differential pairs A0-A1 and A2-A3
+PAIRS = (0x0000, 0x3000)
+
+# Set gain for 0-3.3V range (best resolution)
+# gain = 2 gives ±2.048V range, but since ADS1115 measures ±,
+# this gives us 0-4.096V range which is perfect for 3.3V max
+# Start conversion, gain 1 (±4.096V), single-shot, 128 SPS, comparator off
+CONFIG_BASE = 0x8000 | 0x0200 | 0x0100 | 0x0080 | 0x0003
+
+# One conversion at 128 SPS, plus margin for the chip's oscillator tolerance
+CONVERSION_TIME = 1.0 / 128 + 0.001
+
+# Volts per count at gain 1 (±4.096V), the scale AnalogIn.voltage applies
+VOLTS_PER_COUNT = 4.096 / 32767
+
+_unpack_i16be = struct.Struct('>h').unpack
+
+def start_conversions(bus, starts):
+    """Write each config message back to back; every chip starts converting at once"""
+    for msg in starts:
+        bus.i2c_rdwr(msg)
+
+def read_conversions(bus, reads):
+    """
+    Read the conversion register of each chip back to back.
+
+    Args:
+        reads: (pointer message, 2-byte read message) per chip
+
+    Returns:
+        list: Signed raw values, in the order of reads
+    """
+    values = []
+    for ptr, result in reads:
+        bus.i2c_rdwr(ptr, result)
+        values.append(_unpack_i16be(bytes(result))[0])
+    return values
 
 def test_ads1115_simple():
     try:
-        # Create I2C bus
-        i2c = busio.I2C(board.SCL, board.SDA)
-
-        # Create ADS object with your specific address
-        ads1 = ADS.ADS1115(i2c, address=0x48)
-        ads2 = ADS.ADS1115(i2c, address=0x49)
-        ads3 = ADS.ADS1115(i2c, address=0x4a)
-
-        # Set gain for 0-3.3V range (best resolution)
-        # gain = 2 gives ±2.048V range, but since ADS1115 measures ±,
-        # this gives us 0-4.096V range which is perfect for 3.3V max
-        ads1.gain = 1
-        ads2.gain = 1
-        ads3.gain = 1
-
-        channels = set()
-
-        # Create channel A0
-        channels.add( AnalogIn(ads1, 0, 1) )
-        channels.add( AnalogIn(ads1, 2, 3) )
-        channels.add( AnalogIn(ads2, 0, 1) )
-        channels.add( AnalogIn(ads2, 2, 3) )
-        channels.add( AnalogIn(ads3, 0, 1) )
-        channels.add( AnalogIn(ads3, 2, 3) )
+        bus = smbus2.SMBus(1)
+
+        # One list of start messages per pair, each starting that pair on every chip
+        passes = [[i2c_msg.write(addr, [1, (CONFIG_BASE | mux) >> 8, (CONFIG_BASE | mux) & 0xFF])
+                   for addr in ADDRESSES]
+                  for mux in PAIRS]
+        # Register pointer writes and read buffers, reused for every transfer
+        reads = [(i2c_msg.write(addr, [0]), i2c_msg.read(addr, 2)) for addr in ADDRESSES]
 
         print("ADS1115 Test - Address 0x49, Channel A0 - A1 differential")
         print("Gain: ±2.048V (optimized for 0-3.3V)")
@@ -43,13 +69,17 @@ def test_ads1115_simple():
 
         # Take continuous readings
         reading_count = 1
+        raw_values = [0] * (len(ADDRESSES) * len(PAIRS))
         while True:
-            chan_id = 1
-            for channel in channels:
-                voltage = channel.voltage
-                raw_value = channel.value
+            for pair_index, starts in enumerate(passes):
+                start_conversions(bus, starts)
+                time.sleep(CONVERSION_TIME)
+                # Channels are numbered chip by chip: chip 0 A0-A1, chip 0 A2-A3, chip 1 A0-A1, ...
+                raw_values[pair_index::len(PAIRS)] = read_conversions(bus, reads)
+
+            for chan_id, raw_value in enumerate(raw_values, 1):
+                voltage = raw_value * VOLTS_PER_COUNT
                 print(f"Reading {chan_id} {reading_count:3d}: {voltage:.4f}V (raw: {raw_value})")
-                chan_id += 1
             print("********")
 
             reading_count += 1
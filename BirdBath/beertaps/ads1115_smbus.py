@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+ADS1115 Channel Sweep over smbus2
+
+ADS1115Sweep reads the channels of one ADS1115 in single-shot mode with
+raw register transfers (smbus2 i2c_rdwr) instead of adafruit_ads1x15.
+Reading a channel starts the next channel's conversion before returning,
+so when the channels are read in order each conversion runs while the
+caller is still handling the previous value. Only the first channel of a
+sweep waits for a full conversion.
+
+ADS1115Continuous samples a single channel in continuous-conversion mode,
+where each read is one conversion-register fetch.
+
+Voltages are scaled the same way as adafruit_ads1x15's AnalogIn.voltage
+(raw * full scale / 32767), and gains use the same values (2/3, 1, 2, 4, 8,
+16), so existing configs and calibrations carry over unchanged.
+
+Usage:
+    from ads1115_smbus import ADS1115Sweep
+
+    adc = ADS1115Sweep(0x48, gain=1, pins=[(0, 1), (2, 3)])
+    for channel in adc.channels:      # read in sweep order
+        print(channel.voltage)
+    adc.close()
+"""
+
+import struct
+import time
+
+import smbus2
+from smbus2 import i2c_msg
+
+
+# Registers
+REG_CONVERSION = 0x00
+REG_CONFIG = 0x01
+
+# Config register bits
+CONFIG_OS = 0x8000            # Write: start a conversion. Read: 1 when idle
+CONFIG_MODE_SINGLE = 0x0100
+CONFIG_COMP_DISABLE = 0x0003
+
+# Adafruit-style gain -> (PGA bits, full-scale voltage)
+GAINS = {
+    2/3: (0x0000, 6.144),
+    1: (0x0200, 4.096),
+    2: (0x0400, 2.048),
+    4: (0x0600, 1.024),
+    8: (0x0800, 0.512),
+    16: (0x0A00, 0.256),
+}
+
+# Samples per second -> DR bits
+DATA_RATES = {
+    8: 0x0000,
+    16: 0x0020,
+    32: 0x0040,
+    64: 0x0060,
+    128: 0x0080,
+    250: 0x00A0,
+    475: 0x00C0,
+    860: 0x00E0,
+}
+
+# (positive pin, negative pin) -> MUX bits; a negative pin of None is single-ended
+MUX = {
+    (0, 1): 0x0000,
+    (0, 3): 0x1000,
+    (1, 3): 0x2000,
+    (2, 3): 0x3000,
+    (0, None): 0x4000,
+    (1, None): 0x5000,
+    (2, None): 0x6000,
+    (3, None): 0x7000,
+}
+
+_I16_BE = struct.Struct('>h')
+
+
+def pin_number(pin):
+    """
+    Normalize a pin as written in the config files.
+
+    Args:
+        pin: 0-3, "P0"-"P3", or None
+
+    Returns:
+        int or None
+    """
+    if isinstance(pin, str):
+        return int(pin.upper().lstrip('P'))
+    return pin
+
+
+def volts_per_count(gain):
+    """
+    Volts per raw count at an Adafruit-style gain.
+
+    Raises:
+        ValueError: For an unsupported gain
+    """
+    if gain not in GAINS:
+        raise ValueError(f"Unsupported gain {gain} (expected one of {', '.join(str(g) for g in GAINS)})")
+    return GAINS[gain][1] / 32767
+
+
+def config_word(pos, neg, gain, data_rate):
+    """
+    Build the MUX, PGA, DR and comparator bits of a config word. The caller
+    adds the OS and MODE bits.
+
+    Args:
+        pos: Positive pin, as accepted by pin_number()
+        neg: Negative pin, as accepted by pin_number()
+        gain: Adafruit-style gain, one of the GAINS keys
+        data_rate: Samples per second, one of the DATA_RATES keys
+
+    Returns:
+        int: Config register bits
+
+    Raises:
+        ValueError: For an unsupported gain, data rate or pin pair
+    """
+    if gain not in GAINS:
+        raise ValueError(f"Unsupported gain {gain} (expected one of {', '.join(str(g) for g in GAINS)})")
+    if data_rate not in DATA_RATES:
+        raise ValueError(f"Unsupported data rate {data_rate} (expected one of {', '.join(str(r) for r in DATA_RATES)})")
+    pair = (pin_number(pos), pin_number(neg))
+    if pair not in MUX:
+        raise ValueError(f"Unsupported pin pair {pos}/{neg}")
+    return MUX[pair] | GAINS[gain][0] | DATA_RATES[data_rate] | CONFIG_COMP_DISABLE
+
+
+class SweepChannel:
+    """
+    One input of an ADS1115Sweep, usable where an AnalogIn was.
+
+    Unlike AnalogIn, only voltage touches the bus; value returns the raw
+    reading taken by the last voltage access.
+    """
+
+    def __init__(self, adc, index):
+        self._adc = adc
+        self._index = index
+        self._value = 0
+
+    @property
+    def voltage(self):
+        """Read the channel and return its voltage"""
+        self._value = self._adc.read(self._index)
+        return self._value * self._adc.volts_per_count
+
+    @property
+    def value(self):
+        """Raw reading from the last voltage access"""
+        return self._value
+
+
+class ADS1115Sweep:
+    """Single-shot reads of a fixed list of inputs on one ADS1115, pipelined in list order."""
+
+    # Longest we poll for a single-shot conversion; 8 SPS takes 125ms
+    CONVERSION_TIMEOUT = 0.2
+
+    def __init__(self, address, gain, pins, data_rate=128, bus=1):
+        """
+        Open the I2C bus and prepare one config word per input.
+
+        Args:
+            address: I2C address as int (0x48) or string ("0x48")
+            gain: Adafruit-style gain, one of the GAINS keys
+            pins: List of (positive_pin, negative_pin) pairs, in sweep order
+            data_rate: Samples per second, one of the DATA_RATES keys
+            bus: I2C bus number, or an open smbus2.SMBus to share
+
+        Raises:
+            ValueError: For an unsupported gain, data rate or pin pair
+        """
+        if isinstance(address, str):
+            address = int(address, 16)
+        self.address = address
+        self.volts_per_count = volts_per_count(gain)
+
+        # Writing one of these messages starts a conversion on that input
+        self._start_msgs = []
+        for pos, neg in pins:
+            config = CONFIG_OS | CONFIG_MODE_SINGLE | config_word(pos, neg, gain, data_rate)
+            self._start_msgs.append(i2c_msg.write(address, [REG_CONFIG, config >> 8, config & 0xFF]))
+
+        # Messages are reused for every transfer; the read buffer is overwritten each time
+        self._config_ptr = i2c_msg.write(address, [REG_CONFIG])
+        self._conversion_ptr = i2c_msg.write(address, [REG_CONVERSION])
+        self._result = i2c_msg.read(address, 2)
+
+        self._pending = None  # Input whose conversion is in flight, if any
+        self._owns_bus = isinstance(bus, int)
+        self.bus = smbus2.SMBus(bus) if self._owns_bus else bus
+        self.channels = tuple(SweepChannel(self, i) for i in range(len(self._start_msgs)))
+
+    def _start(self, index):
+        self.bus.i2c_rdwr(self._start_msgs[index])
+        self._pending = index
+
+    def _wait_for_conversion(self):
+        """Poll the config register until the OS bit reads 1 (conversion done)."""
+        deadline = time.monotonic() + self.CONVERSION_TIMEOUT
+        while True:
+            self.bus.i2c_rdwr(self._config_ptr, self._result)
+            if bytes(self._result)[0] & 0x80:
+                return
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"ADS1115 at {hex(self.address)} did not finish converting")
+
+    def read(self, index):
+        """
+        Read input *index* and start the conversion of the next input in the
+        sweep, if there is one.
+
+        Args:
+            index: Position of the input in the pins list
+
+        Returns:
+            int: Signed raw reading
+        """
+        if self._pending != index:
+            # Read out of sweep order (or first of a sweep): nothing to overlap with
+            self._start(index)
+        self._wait_for_conversion()
+        self.bus.i2c_rdwr(self._conversion_ptr, self._result)
+        raw_value, = _I16_BE.unpack(bytes(self._result))
+
+        if index + 1 < len(self._start_msgs):
+            self._start(index + 1)
+        else:
+            self._pending = None
+        return raw_value
+
+    def close(self):
+        """Close the bus, unless it was passed in open"""
+        if self._owns_bus:
+            self.bus.close()
+
+
+class ADS1115Continuous:
+    """
+    One input of an ADS1115 in continuous-conversion mode, usable where an
+    AnalogIn was, for loops that sample a single channel as fast as they can.
+
+    The config is written once, when the object is created; after that each
+    read is one combined transfer of the conversion register through
+    messages built up front. Readings faster than the data rate return the
+    latest finished conversion again.
+    """
+
+    def __init__(self, address, gain, pin_pair, data_rate=128, bus=1):
+        """
+        Open the I2C bus, select the input and start converting.
+
+        Args:
+            address: I2C address as int (0x48) or string ("0x48")
+            gain: Adafruit-style gain, one of the GAINS keys
+            pin_pair: (positive_pin, negative_pin)
+            data_rate: Samples per second, one of the DATA_RATES keys
+            bus: I2C bus number, or an open smbus2.SMBus to share
+
+        Raises:
+            ValueError: For an unsupported gain, data rate or pin pair
+        """
+        if isinstance(address, str):
+            address = int(address, 16)
+        self.address = address
+        self.volts_per_count = volts_per_count(gain)
+        config = config_word(pin_pair[0], pin_pair[1], gain, data_rate)
+
+        self._conversion_ptr = i2c_msg.write(address, [REG_CONVERSION])
+        self._result = i2c_msg.read(address, 2)
+
+        self._owns_bus = isinstance(bus, int)
+        self.bus = smbus2.SMBus(bus) if self._owns_bus else bus
+        self.bus.i2c_rdwr(i2c_msg.write(address, [REG_CONFIG, config >> 8, config & 0xFF]))
+        # The conversion register holds the previous input's result until the
+        # first conversion on the new one finishes; wait two periods, as
+        # adafruit_ads1x15 does after a mode change
+        time.sleep(2 / data_rate)
+
+    @property
+    def value(self):
+        """Signed raw reading of the latest conversion"""
+        self.bus.i2c_rdwr(self._conversion_ptr, self._result)
+        return _I16_BE.unpack(bytes(self._result))[0]
+
+    @property
+    def voltage(self):
+        """Voltage of the latest conversion"""
+        return self.value * self.volts_per_count
+
+    def close(self):
+        """Close the bus, unless it was passed in open"""
+        if self._owns_bus:
+            self.bus.close()
@@ -6,7 +6,7 @@ Used by both calibrate.py (CLI) and BirdBathController.py (web UI).
 Provides channel discovery, live voltage reading, timed min-max capture,
 calibration persistence, and ADC service control.
 
-Hardware modules (board / busio / adafruit_ads1x15) are imported lazily —
+Hardware modules (board / busio / adafruit_ads1x15 / smbus2) are imported lazily —
 it is safe to import this module on a non-Pi development machine.
 """
 
@@ -15,6 +15,7 @@ import os
 import subprocess
 import sys
 import time
+from array import array
 from typing import Callable, Dict, List, Optional, Tuple
 
 
@@ -39,15 +40,18 @@ class ChannelInfo:
     def __init__(self, name: str, config_file: str, channel_index: int,
                  adc_address: int, adc_gain: int,
                  positive_pin: int, negative_pin: int,
-                 calibration: dict):
+                 calibration: dict, adc_config: Optional[dict] = None,
+                 adc_data_rate: int = 128):
         self.name = name
         self.config_file = config_file
         self.channel_index = channel_index
         self.adc_address = adc_address
         self.adc_gain = adc_gain
+        self.adc_data_rate = adc_data_rate  # Samples per second, as adc_reader.py uses
         self.positive_pin = positive_pin
         self.negative_pin = negative_pin
         self.calibration = calibration  # {'min_voltage': float, 'max_voltage': float}
+        self.adc_config = adc_config    # Parsed config_file, shared by its channels
 
     def to_dict(self) -> dict:
         return {
@@ -115,6 +119,7 @@ def load_all_channels(
 
         address = _normalize_address(cfg['address'])
         gain = cfg.get('gain', 1)
+        data_rate = cfg.get('data_rate', 128)
 
         for idx, ch in enumerate(cfg['channels']):
             info = ChannelInfo(
@@ -126,6 +131,8 @@ def load_all_channels(
                 positive_pin=ch['positive_pin'],
                 negative_pin=ch['negative_pin'],
                 calibration=dict(ch['calibration']),
+                adc_config=cfg,
+                adc_data_rate=data_rate,
             )
             channels[ch['name']] = info
 
@@ -144,9 +151,8 @@ def save_calibration(channel_name: str, min_voltage: float, max_voltage: float,
 
     info = channels[channel_name]
 
-    with open(info.config_file, 'r') as f:
-        config = json.load(f)
-
+    # load_all_channels just parsed this file; update that copy rather than reading it again
+    config = info.adc_config
     config['channels'][info.channel_index]['calibration']['min_voltage'] = min_voltage
     config['channels'][info.channel_index]['calibration']['max_voltage'] = max_voltage
 
@@ -167,25 +173,73 @@ def _ensure_beertaps_on_path(calibrate_json: str) -> None:
         sys.path.insert(0, d)
 
 
-def _open_adc_channel(info: ChannelInfo):
+# Hardware objects, created on first use and reused by later calls in the
+# same process (the web UI and the CLI menu read the same channels many times)
+_i2c_bus = None
+_smbus_cache: Dict[int, object] = {}
+_ads_cache: Dict[Tuple[int, float, int], object] = {}
+_adc_channel_cache: Dict[Tuple[int, float, int, int, int], object] = {}
+
+
+def _open_adc_channel(info: ChannelInfo, continuous: bool = False):
     """
-    Open the I2C bus and return an AnalogIn channel object.
+    Return an AnalogIn channel object for the channel. The I2C bus is opened
+    once and reused; so are the ADS1115 object for each address and the
+    AnalogIn for each channel.
+
+    With continuous=True the channel is an ads1115_smbus.ADS1115Continuous
+    instead, for loops that sample this one channel repeatedly: the chip is
+    put in continuous-conversion mode and each read is a single raw smbus2
+    transfer of the conversion register, with none of adafruit_ads1x15's
+    per-read overhead. It has the same voltage/value interface, and is
+    created fresh each time so the config write always happens.
+
     Caller must already hold the I2C lock for info.adc_address.
     Raises ImportError if hardware libraries are not available.
     """
+    global _i2c_bus
+
+    if continuous:
+        import smbus2                                     # type: ignore
+        from ads1115_smbus import ADS1115Continuous       # type: ignore
+
+        bus_number = info.adc_config.get('i2c_bus', 1)
+        bus = _smbus_cache.get(bus_number)
+        if bus is None:
+            bus = _smbus_cache[bus_number] = smbus2.SMBus(bus_number)
+        return ADS1115Continuous(info.adc_address, info.adc_gain,
+                                 (info.positive_pin, info.negative_pin),
+                                 data_rate=info.adc_data_rate, bus=bus)
+
     import board                                          # type: ignore
     import busio                                          # type: ignore
     import adafruit_ads1x15.ads1115 as ADS               # type: ignore
     from adafruit_ads1x15.analog_in import AnalogIn       # type: ignore
 
-    i2c = busio.I2C(board.SCL, board.SDA)
-    ads = ADS.ADS1115(i2c, address=info.adc_address)
-    ads.gain = info.adc_gain
+    key = (info.adc_address, info.adc_gain, info.adc_data_rate,
+           info.positive_pin, info.negative_pin)
+    channel = _adc_channel_cache.get(key)
+    if channel is not None:
+        return channel
+
+    if _i2c_bus is None:
+        _i2c_bus = busio.I2C(board.SCL, board.SDA)
+
+    ads_key = (info.adc_address, info.adc_gain, info.adc_data_rate)
+    ads = _ads_cache.get(ads_key)
+    if ads is None:
+        ads = ADS.ADS1115(_i2c_bus, address=info.adc_address)
+        ads.gain = info.adc_gain
+        ads.data_rate = info.adc_data_rate
+        _ads_cache[ads_key] = ads
+
     print("Attempting to get info on the positive and negative pins")
     pos = info.positive_pin
     neg = info.negative_pin
     print("Got info on the positive and negative pins")
-    return AnalogIn(ads, pos, neg)
+    channel = AnalogIn(ads, pos, neg)
+    _adc_channel_cache[key] = channel
+    return channel
 
 
 def read_voltage(channel_name: str,
@@ -232,7 +286,8 @@ def capture_minmax(
         channel_name:       Tap name, e.g. "tap1".
         duration:           Maximum capture time in seconds.
         calibrate_json:     Path to calibrate.json.
-        stop_event:         Optional threading.Event; capture ends when set.
+        stop_event:         Optional threading.Event; capture ends within
+                            about 0.2s of it being set.
         progress_callback:  Called ~5×/second with
                             (elapsed_seconds, current_voltage,
                              tracked_min, tracked_max).
@@ -250,35 +305,50 @@ def capture_minmax(
     info = channels[channel_name]
 
     with I2CLock(info.adc_address):
-        ch = _open_adc_channel(info)
+        ch = _open_adc_channel(info, continuous=True)
 
         initial = ch.voltage
         tracked_min = initial
         tracked_max = initial
         sample_count = 0
-        start = time.time()
+        # Monotonic, so an NTP step can't stretch or cut short the capture
+        _now = time.monotonic
+        start = _now()
         last_cb = start
 
+        # Samples since the last tick. They are folded into the min/max once
+        # per tick by the C min()/max() builtins, rather than compared one by
+        # one in the sampling loop
+        pending = array('d')
+        append = pending.append
+
         while True:
-            elapsed = time.time() - start
+            # One clock read per sample serves both the duration and tick checks
+            now = _now()
+            elapsed = now - start
             if elapsed >= duration:
                 break
-            if stop_event is not None and stop_event.is_set():
-                break
 
-            voltage = ch.voltage
-            sample_count += 1
-            if voltage < tracked_min:
-                tracked_min = voltage
-            if voltage > tracked_max:
-                tracked_max = voltage
-
-            now = time.time()
-            if progress_callback is not None and (now - last_cb) >= 0.2:
-                progress_callback(elapsed, voltage, tracked_min, tracked_max)
+            append(ch.voltage)
+
+            if (now - last_cb) >= 0.2:
+                # stop_event is only polled here, once per tick
+                if stop_event is not None and stop_event.is_set():
+                    break
+                sample_count += len(pending)
+                tracked_min = min(tracked_min, min(pending))
+                tracked_max = max(tracked_max, max(pending))
+                if progress_callback is not None:
+                    progress_callback(elapsed, pending[-1], tracked_min, tracked_max)
+                del pending[:]
                 last_cb = now
 
-    actual_duration = time.time() - start
+        if pending:
+            sample_count += len(pending)
+            tracked_min = min(tracked_min, min(pending))
+            tracked_max = max(tracked_max, max(pending))
+
+    actual_duration = _now() - start
     warning = ''
     if tracked_max - tracked_min < 0.1:
         warning = 'Small range detected — may not have moved through full range'
@@ -355,6 +425,18 @@ def start_adc_services() -> Tuple[bool, str]:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _calibration_coefficients(min_v: float, max_v: float) -> Tuple[float, float]:
+    """
+    (scale, offset) such that voltage * scale + offset maps [min_v, max_v]
+    onto [-1.0, 1.0], for loops that calibrate many samples against the same
+    range. min_v == max_v gives (0.0, 0.0), matching _apply_calibration().
+    """
+    if max_v == min_v:
+        return 0.0, 0.0
+    scale = 2.0 / (max_v - min_v)
+    return scale, -1.0 - min_v * scale
+
+
 def _apply_calibration(voltage: float, min_v: float, max_v: float) -> float:
     if max_v == min_v:
         return 0.0
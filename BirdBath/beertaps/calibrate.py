@@ -154,7 +154,7 @@ def _cli_endstop_averaging(channel_name: str, calibrate_json: str,
         return False
 
     try:
-        ch = _open_adc_channel(info)
+        ch = _open_adc_channel(info, continuous=True)
 
         max_samples, min_samples = [], []
         initial_voltage = ch.voltage
@@ -164,23 +164,14 @@ def _cli_endstop_averaging(channel_name: str, calibrate_json: str,
         latest_max = latest_min = None
 
         display_interval = 0.2
-        last_display = time.time()
+        _now = time.monotonic
+        last_display = _now()
         sample_count = 0
         current_voltage = initial_voltage
 
-        # Optional Enter-key early exit
-        done_flag = threading.Event()
-
-        def wait_for_enter():
-            input()
-            done_flag.set()
-
-        enter_thread = threading.Thread(target=wait_for_enter, daemon=True)
-        enter_thread.start()
-
         try:
             while (len(max_samples) < endstop_sample_count or
-                   len(min_samples) < endstop_sample_count) and not done_flag.is_set():
+                   len(min_samples) < endstop_sample_count):
 
                 voltage = ch.voltage
                 sample_count += 1
@@ -211,8 +202,12 @@ def _cli_endstop_averaging(channel_name: str, calibrate_json: str,
                         looking_for = 'max'
                         current_extreme = voltage
 
-                now = time.time()
+                now = _now()
                 if now - last_display >= display_interval:
+                    # Optional Enter-key early exit, only checked here, not on every sample
+                    if select.select([sys.stdin], [], [], 0)[0]:
+                        sys.stdin.readline()
+                        break
                     side = 'ABOVE' if looking_for == 'max' else 'BELOW'
                     max_s = f"{len(max_samples)}/{endstop_sample_count}"
                     if latest_max is not None:
@@ -283,10 +278,14 @@ def _cli_monitor_channel(channel_name: str, calibrate_json: str) -> None:
         return
 
     try:
-        ch = _open_adc_channel(info)
+        ch = _open_adc_channel(info, continuous=True)
         cal = info.calibration
+        volts_per_count = ch.volts_per_count
+        scale, offset = beertap_calibration_core._calibration_coefficients(
+            cal['min_voltage'], cal['max_voltage'])
         display_interval = 0.2
-        last_display = time.time()
+        _now = time.monotonic
+        last_display = _now()
         sample_count = 0
 
         old_settings = termios.tcgetattr(sys.stdin)
@@ -296,13 +295,14 @@ def _cli_monitor_channel(channel_name: str, calibrate_json: str) -> None:
                 if select.select([sys.stdin], [], [], 0)[0]:
                     sys.stdin.read(1)
                     break
-                voltage = ch.voltage
+                # One conversion per sample: each AnalogIn property access is
+                # a full I2C read, so scale the raw value here instead
                 raw = ch.value
+                voltage = raw * volts_per_count
                 sample_count += 1
-                now = time.time()
+                now = _now()
                 if now - last_display >= display_interval:
-                    calibrated = beertap_calibration_core._apply_calibration(
-                        voltage, cal['min_voltage'], cal['max_voltage'])
+                    calibrated = max(-1.0, min(1.0, voltage * scale + offset))
                     elapsed = now - last_display
                     hz = sample_count / elapsed if elapsed > 0 else 0
                     print(f'\rVoltage {voltage:+.4f}V (raw {raw:5d}) → '
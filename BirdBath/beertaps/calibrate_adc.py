@@ -9,12 +9,17 @@ import json
 import argparse
 import time
 import os
+import select
 import sys
+from array import array
 import board
 import busio
+import smbus2
 import adafruit_ads1x15.ads1115 as ADS
 from adafruit_ads1x15.analog_in import AnalogIn
 
+from ads1115_smbus import ADS1115Continuous, volts_per_count
+from beertap_calibration_core import _calibration_coefficients
 from i2c_lock import I2CLock, I2CDeviceInUseError
 
 
@@ -31,9 +36,15 @@ class ADCCalibrator:
             self.config = json.load(f)
 
     def save_config(self):
-        """Save configuration back to JSON file"""
-        with open(self.config_file, 'w') as f:
+        """
+        Save configuration back to JSON file. Writes a temporary file and
+        renames it over the original, so an interrupted save can't leave a
+        truncated config for the reader service to load.
+        """
+        tmp = self.config_file + '.tmp'
+        with open(tmp, 'w') as f:
             json.dump(self.config, f, indent=2)
+        os.replace(tmp, self.config_file)
 
     def setup_adc(self):
         """Initialize I2C and ADC with configured address"""
@@ -55,10 +66,18 @@ class ADCCalibrator:
 
             # Create I2C bus
             self.i2c = busio.I2C(board.SCL, board.SDA)
+            self.smbus = None  # Raw bus for open_continuous(), opened on first use
 
             # Create ADS object with configured address
             self.ads = ADS.ADS1115(self.i2c, address=address)
             self.ads.gain = self.config['gain']
+            # Same optional key and default as adc_reader.py, so calibration
+            # sees the noise the reader will
+            self.data_rate = self.config.get('data_rate', 128)
+            self.ads.data_rate = self.data_rate
+            # Scale AnalogIn.voltage applies to .value; reading .value and
+            # scaling it here takes one conversion where reading both takes two
+            self.volts_per_count = volts_per_count(self.config['gain'])
 
             # Create channel objects
             self.channels = []
@@ -82,6 +101,26 @@ class ADCCalibrator:
             print(f"Error initializing ADC: {e}")
             sys.exit(1)
 
+    def open_continuous(self, ch_config):
+        """
+        Put the ADC in continuous-conversion mode on one channel, for loops
+        that sample just that channel. Reads go through raw smbus2 transfers
+        rather than adafruit_ads1x15: each one is a single combined
+        conversion-register fetch, with no config write or conversion wait.
+
+        The config is written every time this is called, so the result is
+        never left over from self.ads' single-shot reads.
+
+        Returns:
+            ADS1115Continuous: Channel to read in place of the single-shot one
+                (same voltage/value interface as AnalogIn)
+        """
+        if self.smbus is None:
+            self.smbus = smbus2.SMBus(self.config.get('i2c_bus', 1))
+        return ADS1115Continuous(self.address, self.config['gain'],
+                                 (ch_config['positive_pin'], ch_config['negative_pin']),
+                                 data_rate=self.data_rate, bus=self.smbus)
+
     def read_current_values(self):
         """Read and display current values from all channels"""
         print("\n" + "="*60)
@@ -93,19 +132,16 @@ class ADCCalibrator:
             name = ch_info['name']
             config = ch_info['config']
 
-            voltage = channel.voltage
             raw = channel.value
+            voltage = raw * self.volts_per_count
 
             cal = config['calibration']
             min_v = cal['min_voltage']
             max_v = cal['max_voltage']
 
             # Calculate calibrated value
-            if max_v != min_v:
-                normalized = (voltage - min_v) / (max_v - min_v)
-                calibrated = 2.0 * normalized - 1.0
-            else:
-                calibrated = 0.0
+            cal_scale, cal_offset = _calibration_coefficients(min_v, max_v)
+            calibrated = voltage * cal_scale + cal_offset
 
             print(f"\nChannel {i+1}: {name}")
             print(f"  Current voltage: {voltage:.4f}V (raw: {raw})")
@@ -121,7 +157,6 @@ class ADCCalibrator:
             return False
 
         ch_info = self.channels[channel_index]
-        channel = ch_info['channel']
         name = ch_info['name']
         config = ch_info['config']
 
@@ -132,6 +167,9 @@ class ADCCalibrator:
         else:
             print(f"\n--- Calibrating {name} ---")
 
+        # Only this channel is sampled until Enter, so let the chip convert continuously
+        channel = self.open_continuous(config)
+
         # Initialize with current reading
         initial_voltage = channel.voltage
         tracked_min = initial_voltage
@@ -140,53 +178,43 @@ class ADCCalibrator:
         print("\nMove your control through its FULL range")
         print("Press Enter when done, Ctrl+C to cancel\n")
 
-        # Start a thread to check for Enter key
-        import threading
-        done_flag = threading.Event()
-
-        def wait_for_enter():
-            input()
-            done_flag.set()
-
-        enter_thread = threading.Thread(target=wait_for_enter)
-        enter_thread.daemon = True
-        enter_thread.start()
-
         # Display update timing
         display_interval = 0.2  # Update display 5 times per second
-        last_display_time = time.time()
-        sample_count = 0
+        _now = time.monotonic
+        last_display_time = _now()
+
+        # Samples since the last display update. They are folded into the
+        # min/max once per update by the C min()/max() builtins, rather than
+        # compared one by one in the sampling loop
+        pending = array('d')
+        append = pending.append
 
-        # Variables for display
-        current_voltage = initial_voltage
-        current_raw = 0
+        # Bound once; the loop below runs for every sample
+        scale = self.volts_per_count
 
         try:
-            while not done_flag.is_set():
+            while True:
                 # Sample as fast as possible
-                voltage = channel.voltage
-                raw = channel.value
-                sample_count += 1
-
-                # Update tracked min/max from every sample
-                if voltage < tracked_min:
-                    tracked_min = voltage
-                if voltage > tracked_max:
-                    tracked_max = voltage
-
-                # Store current values for display
-                current_voltage = voltage
-                current_raw = raw
+                append(channel.value * scale)
 
                 # Only update display at controlled rate
-                current_time = time.time()
+                current_time = _now()
                 if current_time - last_display_time >= display_interval:
+                    # Enter ends the run; only checked here, not on every sample
+                    if select.select([sys.stdin], [], [], 0)[0]:
+                        sys.stdin.readline()
+                        break
+
+                    # Update tracked min/max from every sample since the last update
+                    tracked_min = min(tracked_min, min(pending))
+                    tracked_max = max(tracked_max, max(pending))
+                    current_voltage = pending[-1]
+                    sample_count = len(pending)
+                    del pending[:]
+
                     # Calculate what the calibrated value would be
-                    if tracked_max != tracked_min:
-                        normalized = (current_voltage - tracked_min) / (tracked_max - tracked_min)
-                        calibrated = 2.0 * normalized - 1.0
-                    else:
-                        calibrated = 0.0
+                    cal_scale, cal_offset = _calibration_coefficients(tracked_min, tracked_max)
+                    calibrated = current_voltage * cal_scale + cal_offset
 
                     # Calculate sampling rate
                     elapsed = current_time - last_display_time
@@ -203,12 +231,15 @@ class ADCCalibrator:
 
                     # Reset counters for next display cycle
                     last_display_time = current_time
-                    sample_count = 0
 
         except KeyboardInterrupt:
             print("\n\nCalibration cancelled")
             return False
 
+        if pending:
+            tracked_min = min(tracked_min, min(pending))
+            tracked_max = max(tracked_max, max(pending))
+
         print(f"\n\nResults for {name}:")
         print(f"  Min: {tracked_min:.4f}V | Max: {tracked_max:.4f}V | Range: {tracked_max - tracked_min:.4f}V")
 
@@ -329,31 +360,29 @@ class ADCCalibrator:
 
             elif choice == '5':
                 print("\nMonitoring (press Ctrl+C to stop)...")
+                monitor_channel = self.open_continuous(config)
 
                 # Display update timing
                 display_interval = 0.2  # Update display 5 times per second
-                last_display_time = time.time()
+                _now = time.monotonic
+                last_display_time = _now()
                 sample_count = 0
+                scale = self.volts_per_count
+                # The calibration can't change while monitoring, so map it once
+                cal = config['calibration']
+                cal_scale, cal_offset = _calibration_coefficients(cal['min_voltage'], cal['max_voltage'])
 
                 try:
                     while True:
                         # Sample as fast as possible
-                        voltage = channel.voltage
-                        raw = channel.value
+                        raw = monitor_channel.value
+                        voltage = raw * scale
                         sample_count += 1
 
                         # Only update display at controlled rate
-                        current_time = time.time()
+                        current_time = _now()
                         if current_time - last_display_time >= display_interval:
-                            cal = config['calibration']
-                            min_v = cal['min_voltage']
-                            max_v = cal['max_voltage']
-
-                            if max_v != min_v:
-                                normalized = (voltage - min_v) / (max_v - min_v)
-                                calibrated = 2.0 * normalized - 1.0
-                            else:
-                                calibrated = 0.0
+                            calibrated = voltage * cal_scale + cal_offset
 
                             # Calculate sampling rate
                             elapsed = current_time - last_display_time
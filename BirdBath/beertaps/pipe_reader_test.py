@@ -1,13 +1,11 @@
 #!/usr/bin/env python3
 """
 Named Pipe Reader Test
-Reads pickled data from the shared named pipe created by adc_reader.py instances
+Reads fixed-size channel frames from the shared named pipe created by adc_reader.py instances
 Shows a dashboard view with current values and staleness for each channel
 """
 
-import pickle
 import argparse
-import struct
 import os
 import sys
 import time
@@ -15,13 +13,15 @@ import select
 import fcntl
 import termios
 
+from adc_message import CHANNEL_NAMES, FRAME
+
 
 class PipeReader:
     def __init__(self, pipe_path):
         """Initialize pipe reader with a single pipe path"""
         self.pipe_path = pipe_path
         self.pipe_fd = None
-        self.buffer = b''  # Buffer for incomplete messages
+        self.buffer = bytearray()  # Buffer for incomplete frames
         self.channels = {}  # Dict to store channel data and timestamps
         self.setup_pipe()
 
@@ -61,26 +61,14 @@ class PipeReader:
             self.buffer += chunk
 
             # Process complete messages from buffer
-            while len(self.buffer) >= 4:
-                # Try to read length header
-                length = struct.unpack('>I', self.buffer[:4])[0]
-
-                # Check if we have the complete message
-                if len(self.buffer) >= 4 + length:
-                    # Extract the message
-                    pickled_data = self.buffer[4:4+length]
-                    self.buffer = self.buffer[4+length:]
-
-                    # Unpickle the object
-                    try:
-                        data = pickle.loads(pickled_data)
-                        yield data
-                    except Exception as e:
-                        if hasattr(self, 'verbose') and self.verbose:
-                            print(f"Error unpickling data: {e}")
-                else:
-                    # Wait for more data
-                    break
+            while len(self.buffer) >= FRAME.size:
+                channel_id, value = FRAME.unpack_from(self.buffer, 0)
+                del self.buffer[:FRAME.size]
+
+                if channel_id < len(CHANNEL_NAMES):
+                    yield CHANNEL_NAMES[channel_id], value
+                elif hasattr(self, 'verbose') and self.verbose:
+                    print(f"Unknown channel id {channel_id}")
 
         except (BlockingIOError, OSError):
             pass
@@ -146,15 +134,10 @@ class PipeReader:
 
                 if ready:
                     # Read and process messages
-                    for data in self.read_messages():
-                        channel = data.get('channel', 'unknown')
-                        value = data.get('value', 0.0)
-                        timestamp = data.get('timestamp', time.time())
-
+                    for channel, value in self.read_messages():
                         # Store or update channel data
                         self.channels[channel] = {
                             'value': value,
-                            'timestamp': timestamp,
                             'last_update': time.time()
                         }
 
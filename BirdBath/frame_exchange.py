@@ -0,0 +1,272 @@
+import multiprocessing
+import time
+from typing import Optional
+import numpy as np
+
+
+NOZZLE_COUNT = 36
+
+# Numba is optional; without it FrameExchange.reduce() uses the NumPy path
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Compiled eagerly (and cached on disk) so the first frame doesn't stall on the JIT
+    @njit('void(float32[:, ::1], boolean[::1], float32[::1])',
+          cache=True, fastmath=True, boundscheck=False)
+    def _reduce_clip(frames, valid, out):
+        """Sum the valid rows of frames into out and clamp to [-1.0, 1.0] in one pass."""
+        for j in range(frames.shape[1]):
+            s = 0.0
+            for i in range(frames.shape[0]):
+                if valid[i]:
+                    s += frames[i, j]
+            if s > 1.0:
+                s = 1.0
+            elif s < -1.0:
+                s = -1.0
+            out[j] = s
+else:
+    _reduce_clip = None
+
+
+class FrameExchange:
+    """
+    Shared-memory transport between the main process and the pattern processes.
+
+    Holds one (pattern_count, 36) float32 frame block and one input value per
+    pattern, both allocated with RawArray. Each frame the main process writes
+    the inputs and releases every process's 'start' semaphore; pattern process
+    i reads inputs[i], writes its frame into row i and releases the shared
+    'done' semaphore. Nothing per frame goes through pickle or a pipe. Pattern
+    processes normally bind their pattern's values array to their row, so the
+    frame is written in place and not copied at all.
+
+    Once the frames are in, the main process releases 'frame_ready' and the
+    pattern driver process sums and clamps the rows into the shared 'final'
+    buffer itself, releases 'reduced' and sends the frame out. The main process
+    never handles the payload; it only copies 'final' for the web UI. It
+    doesn't wait for 'reduced' straight away either, only at the start of the
+    next frame, so the reduction overlaps the main process's frame sleep.
+
+    Each process has its own start semaphore: with one shared semaphore a fast
+    process could take two tokens and run twice while a slow one never runs.
+    A process that misses a frame's deadline isn't started again until it has
+    published: another token would have it run frames back to back, rewriting
+    its row while the driver sums it. Publishing only sets the row's
+    'published' flag; the main process marks a row valid only if it was
+    started this frame, so a late result is never counted or summed.
+
+    The object is passed to each pattern process as a Process argument, and
+    rebuilds its numpy views on the other side.
+    """
+
+    # numpy views, rebuilt by _attach() instead of pickled
+    _VIEWS = ('frames', 'valid', 'published', 'inputs', 'final')
+
+    def __init__(self, pattern_count: int):
+        """
+        Allocate the shared buffers and semaphores.
+
+        Args:
+            pattern_count (int): Number of pattern processes (one row each)
+        """
+        self.pattern_count = pattern_count
+        self._frames_buf = multiprocessing.RawArray('f', pattern_count * NOZZLE_COUNT)
+        self._valid_buf = multiprocessing.RawArray('b', pattern_count)
+        self._published_buf = multiprocessing.RawArray('b', pattern_count)
+        self._inputs_buf = multiprocessing.RawArray('d', pattern_count)
+        self._final_buf = multiprocessing.RawArray('f', NOZZLE_COUNT)
+        self.start = [multiprocessing.Semaphore(0) for _ in range(pattern_count)]
+        self.done = multiprocessing.Semaphore(0)
+        self.frame_ready = multiprocessing.Semaphore(0)
+        self.reduced = multiprocessing.Semaphore(0)
+        self.stop = multiprocessing.Event()
+        # Main process only: rows started and not yet seen to publish
+        self._outstanding = [False] * pattern_count
+        self._attach()
+
+    def _attach(self):
+        """Create numpy views onto the shared buffers."""
+        self.frames = np.frombuffer(self._frames_buf, dtype=np.float32).reshape(
+            self.pattern_count, NOZZLE_COUNT)
+        self.valid = np.frombuffer(self._valid_buf, dtype=np.bool_)
+        self.published = np.frombuffer(self._published_buf, dtype=np.bool_)
+        self.inputs = np.frombuffer(self._inputs_buf, dtype=np.float64)
+        self.final = np.frombuffer(self._final_buf, dtype=np.float32)
+
+    def __getstate__(self):
+        # numpy views would be pickled as copies; send the raw buffers instead
+        return {k: v for k, v in self.__dict__.items() if k not in self._VIEWS}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # Pattern process side
+    # ------------------------------------------------------------------
+
+    def wait_for_start(self, index: int) -> bool:
+        """
+        Block until the main process starts a frame for row *index*.
+
+        Returns:
+            bool: True to run a frame, False if the exchange is shutting down
+        """
+        self.start[index].acquire()
+        return not self.stop.is_set()
+
+    def publish(self, index: int, frame: Optional[np.ndarray] = None) -> None:
+        """
+        Mark row *index* as finished and signal the main process.
+
+        Args:
+            index (int): Row owned by the calling pattern process
+            frame (np.ndarray): 36-element frame to copy into the row, or None
+                if the pattern already wrote the row in place
+        """
+        if frame is not None:
+            self.frames[index, :] = frame
+        self.published[index] = True
+        self.done.release()
+
+    # ------------------------------------------------------------------
+    # Pattern driver process side
+    # ------------------------------------------------------------------
+
+    def wait_for_frame_ready(self) -> bool:
+        """
+        Block until the main process hands over a complete set of rows.
+
+        Returns:
+            bool: True to process a frame, False if the exchange is shutting down
+        """
+        self.frame_ready.acquire()
+        return not self.stop.is_set()
+
+    def reduce_final(self) -> None:
+        """Sum and clamp this frame's rows into self.final and signal the main process."""
+        self.reduce(self.final)
+        self.reduced.release()
+
+    # ------------------------------------------------------------------
+    # Main process side
+    # ------------------------------------------------------------------
+
+    def begin_frame(self) -> None:
+        """Mark every row stale and drop late signals left over from earlier frames."""
+        self.valid[:] = False
+        while self.done.acquire(False):
+            pass
+        while self.reduced.acquire(False):
+            pass
+
+    def start_frame(self, indices) -> list:
+        """
+        Start a frame on the given rows. Write self.inputs first.
+
+        Rows whose process hasn't published an earlier frame yet are skipped.
+
+        Args:
+            indices: Rows whose pattern processes should run this frame
+
+        Returns:
+            list: Rows actually started, to pass to wait_for_frames()
+        """
+        started = []
+        for index in indices:
+            if self._outstanding[index] and not self.published[index]:
+                continue
+            self.published[index] = False
+            self._outstanding[index] = True
+            self.start[index].release()
+            started.append(index)
+        return started
+
+    def shutdown(self) -> None:
+        """Tell every pattern process to exit its frame loop."""
+        self.stop.set()
+        for sem in self.start:
+            sem.release()
+        self.frame_ready.release()
+
+    def hand_to_driver(self) -> None:
+        """
+        Let the pattern driver reduce and send this frame. Returns at once;
+        call wait_for_driver() before the rows are reused.
+        """
+        self.frame_ready.release()
+
+    def wait_for_driver(self, timeout: float) -> bool:
+        """
+        Wait for the pattern driver to finish reducing the frame handed over
+        by hand_to_driver().
+
+        Returns:
+            bool: True once self.final holds that frame's sum, False on timeout
+        """
+        return self.reduced.acquire(timeout=timeout)
+
+    def wait_for_frames(self, started, deadline_ns: int) -> int:
+        """
+        Wait for the rows started this frame to publish, and mark those that
+        did as valid.
+
+        Completions are taken in whatever order the processes finish, and the
+        whole wait shares one deadline, so a frame costs at most the slowest
+        process rather than a timeout per process. A late publish from a row
+        started in an earlier frame wakes the wait but isn't counted.
+
+        Args:
+            started: Rows returned by start_frame() this frame
+            deadline_ns (int): time.monotonic_ns() value after which to give up
+
+        Returns:
+            int: Number of rows received before the deadline
+        """
+        pending = list(started)
+        while True:
+            pending = [index for index in pending if not self.published[index]]
+            if not pending:
+                break
+            # Only read the clock when we actually have to block
+            if not self.done.acquire(False):
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0 or not self.done.acquire(timeout=remaining_ns / 1_000_000_000):
+                    break
+
+        received = 0
+        for index in started:
+            if self.published[index]:
+                self.valid[index] = True
+                self._outstanding[index] = False
+                received += 1
+        return received
+
+    def reduce(self, out: np.ndarray) -> int:
+        """
+        Sum the rows published this frame into *out* and clamp to [-1.0, 1.0].
+
+        Works entirely in place on the shared block and the caller's buffer, so
+        nothing is allocated per frame. With Numba the sum and clamp are one
+        compiled loop that skips rows from processes that did not answer.
+        Otherwise NumPy masks those rows out of the sum. Either way the rows
+        are left untouched, since they double as the patterns' own values
+        arrays. With no rows at all *out* is zeroed.
+
+        Returns:
+            int: Number of rows summed
+        """
+        if _reduce_clip is not None:
+            _reduce_clip(self.frames, self.valid, out)
+            return int(np.count_nonzero(self.valid))
+
+        if self.valid.all():
+            self.frames.sum(axis=0, out=out)
+        else:
+            self.frames.sum(axis=0, out=out, where=self.valid[:, np.newaxis])
+        np.clip(out, -1.0, 1.0, out=out)
+        return int(np.count_nonzero(self.valid))
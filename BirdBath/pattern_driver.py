@@ -5,6 +5,20 @@ import socket
 import struct
 from typing import List, Tuple, Dict
 
+# ArtDMX header: ID, opcode (LE), protocol version (BE), sequence, physical,
+# universe (LE), data length (BE). The byte order is mixed, so the 16-bit
+# fields are packed with two cached Structs rather than one format string.
+ARTNET_ID = b"Art-Net\x00"
+ARTNET_HEADER_SIZE = 18
+_U16_LE = struct.Struct("<H")
+_U16_BE = struct.Struct(">H")
+
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 
 class PatternDriver:
     """
@@ -51,7 +65,7 @@ class PatternDriver:
 
         try:
             with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlSafeLoader)
 
             # Configuration should be a dictionary with 'controllers' and 'ranges' keys
             if not isinstance(config, dict):
@@ -102,29 +116,29 @@ class PatternDriver:
         Returns:
             bytes: Complete Artnet packet
         """
-        # Artnet header
-        header = b"Art-Net\x00"  # 8 bytes
-        opcode = struct.pack("<H", 0x5000)  # ArtDMX opcode (little endian)
-        protocol_version = struct.pack(">H", 14)  # Protocol version (big endian)
-        sequence = struct.pack("B", self.sequence)  # Sequence
-        physical = struct.pack("B", 0)  # Physical input/output port
-        universe_bytes = struct.pack("<H", universe)  # Universe (little endian)
-
         # Data length (2 bytes per tuple: 1 byte bool + 1 byte for float as byte)
-        data_length = struct.pack(">H", len(data) * 2 + 1)  # Big endian
+        data_length = len(data) * 2 + 1
+
+        # Build the whole packet in one buffer; zero-filled, so the bool bytes
+        # and the physical port are already 0
+        packet = bytearray(ARTNET_HEADER_SIZE + data_length)
+
+        # Artnet header
+        packet[0:8] = ARTNET_ID
+        _U16_LE.pack_into(packet, 8, 0x5000)  # ArtDMX opcode (little endian)
+        _U16_BE.pack_into(packet, 10, 14)  # Protocol version (big endian)
+        packet[12] = self.sequence  # Sequence
+        _U16_LE.pack_into(packet, 14, universe)  # Universe (little endian)
+        _U16_BE.pack_into(packet, 16, data_length)  # Big endian
 
         # Pack data as series of [bool, float] where bool is always 0 and float is converted to byte
-        # There is also a header here (the type of packet). In this case, the header is 0.
-        packet_data = bytearray()
-        packet_data.append(0);   # Header meaning 'this is a full frame'
+        # There is also a header here (the type of packet). In this case, the header is 0,
+        # meaning 'this is a full frame'.
+        offset = ARTNET_HEADER_SIZE + 2
         for bool_val, float_val in data:
-            packet_data.append(0)  # Bool is always 0 (false)
             # Convert float to byte (0-255 range)
-            byte_val = max(0, min(255, int(float_val)))
-            packet_data.append(byte_val)
-
-        # Combine all parts
-        packet = header + opcode + protocol_version + sequence + physical + universe_bytes + data_length + packet_data
+            packet[offset] = max(0, min(255, int(float_val)))
+            offset += 2
 
         # Update sequence counter
         self.sequence = (self.sequence + 1) % 256
@@ -1,7 +1,7 @@
 import importlib
 import inspect
 import numpy as np
-from typing import Type, Any
+from typing import Type, Any, Optional
 from pattern import Pattern
 
 
@@ -10,15 +10,20 @@ class PatternRunner:
     A class that instantiates and runs Pattern-derived classes by name.
     """
 
-    def __init__(self, pattern_class_name: str):
+    def __init__(self, pattern_class_name: str, values_array: Optional[np.ndarray] = None):
         """
         Initialize PatternRunner with a Pattern-derived class name.
 
         Args:
             pattern_class_name (str): Name of the class derived from Pattern
+            values_array (np.ndarray): Optional 36-element float32 array for the
+                pattern to write into, e.g. a row of shared memory. A new array
+                is allocated if omitted.
         """
         self.pattern_class_name = pattern_class_name
-        self.values_array = np.zeros(36, dtype=np.float64)  # Create shared numpy array
+        if values_array is None:
+            values_array = np.zeros(36, dtype=np.float32)
+        self.values_array = values_array  # Shared with the pattern and its nozzles
         self.pattern_instance = self._instantiate_pattern_class()
 
     def _instantiate_pattern_class(self) -> Pattern:
@@ -14,13 +14,15 @@ import argparse
 import errno
 import json
 import os
-import pickle
-import struct
+import sys
 import time
 import yaml
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'beertaps'))
+from adc_message import encode_message
+
 
 # ---------------------------------------------------------------------------
 # Pipe-writing helper
@@ -29,7 +31,7 @@ from urllib.parse import urlparse, parse_qs
 def write_to_pipe(pipe_path, channel, value):
     """
     Write a single channel value to the named pipe in the same format that
-    adc_reader.py uses:  4-byte big-endian length  +  pickled dict
+    adc_reader.py uses:  1-byte channel id  +  big-endian float32
 
     Args:
         pipe_path: Path to the named pipe (e.g. /tmp/beertap_pipe)
@@ -42,14 +44,10 @@ def write_to_pipe(pipe_path, channel, value):
     # Clamp value to legal range
     value = max(-1.0, min(1.0, float(value)))
 
-    data = {
-        'channel': channel,
-        'value': value,
-        'timestamp': time.time(),
-    }
-
-    pickled = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
-    message = struct.pack('>I', len(pickled)) + pickled
+    try:
+        message = encode_message(channel, value)
+    except ValueError as e:
+        return False, str(e)
 
     # Create the pipe if it doesn't exist yet
     if not os.path.exists(pipe_path):